@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 
@@ -14,6 +15,24 @@ except ImportError:
 _ICON_PATH = Path(__file__).parent / "resources" / "icon.png"
 _STYLE_PATH = Path(__file__).parent / "resources" / "style.qss"
 
+_ICON_CACHE: QIcon | None = None
+
+
+def _apply_resources(app: QApplication) -> None:
+    """Load the window icon and stylesheet after first paint.
+
+    Decoding the icon and reading the stylesheet are synchronous disk
+    work — deferring them keeps the window visible sooner on startup.
+    """
+    global _ICON_CACHE
+    if _ICON_CACHE is None and _ICON_PATH.exists():
+        _ICON_CACHE = QIcon(str(_ICON_PATH))
+    if _ICON_CACHE is not None:
+        app.setWindowIcon(_ICON_CACHE)
+
+    if _STYLE_PATH.exists():
+        app.setStyleSheet(_STYLE_PATH.read_text(encoding="utf-8"))
+
 
 def main():
     app = QApplication(sys.argv)
@@ -21,13 +40,9 @@ def main():
     app.setApplicationName("PZ Mod Manager")
     app.setApplicationVersion(__version__)
 
-    if _ICON_PATH.exists():
-        app.setWindowIcon(QIcon(str(_ICON_PATH)))
-
-    if _STYLE_PATH.exists():
-        app.setStyleSheet(_STYLE_PATH.read_text(encoding="utf-8"))
-
     window = MainWindow()
     window.show()
 
+    QTimer.singleShot(0, lambda: _apply_resources(app))
+
     sys.exit(app.exec())
@@ -1,10 +1,27 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Mod:
     mod_id: str
     workshop_id: str
     name: str = ""
     description: str = ""
     enabled: bool = True
+    _url: str = field(default="", init=False, repr=False, compare=False)
+    _url_wid: str = field(default="", init=False, repr=False, compare=False)
+
+    @property
+    def workshop_url(self) -> str:
+        """Steam Workshop page URL, built once and reused.
+
+        Rebuilt whenever the workshop_id differs from the one the
+        cached URL was built for (IDs are editable in the table).
+        """
+        if not self._url or self._url_wid != self.workshop_id:
+            self._url_wid = self.workshop_id
+            self._url = (
+                "https://steamcommunity.com/sharedfiles/filedetails/?id="
+                + self.workshop_id
+            )
+        return self._url
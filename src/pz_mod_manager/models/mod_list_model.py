@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from PySide6.QtCore import QModelIndex, Qt, QAbstractTableModel
+from PySide6.QtCore import (
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    QAbstractTableModel,
+)
 
 from pz_mod_manager.models.mod import Mod
 from pz_mod_manager.utils.constants import (
@@ -11,73 +16,143 @@ from pz_mod_manager.utils.constants import (
     COLUMN_WORKSHOP_ID,
 )
 
+# data() is called per-cell on every repaint, so dispatch by indexing a
+# column-aligned tuple of getters instead of a chain of comparisons.
+_ROLE_DISPLAY = Qt.ItemDataRole.DisplayRole
+_ROLE_CHECK = Qt.ItemDataRole.CheckStateRole
+_ROLE_EDIT = Qt.ItemDataRole.EditRole
+_CHECKED = Qt.CheckState.Checked
+_UNCHECKED = Qt.CheckState.Unchecked
+_CHECKED_VALUE = Qt.CheckState.Checked.value
+_FLAG_CHECKABLE = Qt.ItemFlag.ItemIsUserCheckable
+_FLAG_EDITABLE = Qt.ItemFlag.ItemIsEditable
+
+_DISPLAY_GETTERS = (
+    None,  # COLUMN_ENABLED — rendered via CheckStateRole
+    lambda m: m.mod_id,
+    lambda m: m.workshop_id,
+    lambda m: m.name,
+)
+_EDIT_GETTERS = (
+    None,
+    lambda m: m.mod_id,
+    lambda m: m.workshop_id,
+    None,
+)
+
+
+def _search_blob(mod: Mod) -> str:
+    """One pre-lowered string per row so filtering does a single
+    substring scan instead of three .lower() calls per keystroke."""
+    return f"{mod.mod_id}\0{mod.workshop_id}\0{mod.name}".lower()
+
 
 class ModListModel(QAbstractTableModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._mods: list[Mod] = []
+        # Incremental enabled-row counter so status updates don't
+        # re-sum the whole list on every change signal
+        self._enabled_count = 0
+        # Pre-lowered search text per row, kept in lockstep with _mods
+        self._search_blobs: list[str] = []
+        # workshop_id -> [row, ...] so name updates from Steam API
+        # callbacks don't rescan the whole list per workshop item
+        self._wid_index: dict[str, list[int]] = {}
 
     @property
     def mods(self) -> list[Mod]:
+        # The internal list, not a copy — callers iterate far more often
+        # than they snapshot. Do not add/remove entries through this;
+        # use snapshot() for a mutable copy.
+        return self._mods
+
+    def snapshot(self) -> list[Mod]:
+        """A copy of the mod list, safe for callers to mutate."""
         return list(self._mods)
 
+    @property
+    def enabled_count(self) -> int:
+        return self._enabled_count
+
     def set_mods(self, mods: list[Mod]) -> None:
         self.beginResetModel()
         self._mods = list(mods)
+        self._enabled_count = sum(1 for m in self._mods if m.enabled)
+        self._search_blobs = [_search_blob(m) for m in self._mods]
+        self._rebuild_wid_index()
         self.endResetModel()
 
+    def _rebuild_wid_index(self) -> None:
+        index: dict[str, list[int]] = {}
+        for row, mod in enumerate(self._mods):
+            if mod.workshop_id:
+                index.setdefault(mod.workshop_id, []).append(row)
+        self._wid_index = index
+
     def rowCount(self, parent=QModelIndex()) -> int:
         return len(self._mods)
 
     def columnCount(self, parent=QModelIndex()) -> int:
         return len(COLUMN_HEADERS)
 
-    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
-        if not index.isValid() or index.row() >= len(self._mods):
-            return None
+    def data(self, index: QModelIndex, role: int = _ROLE_DISPLAY):
+        # Qt probes many roles per cell per paint; a dict miss is one
+        # hash lookup instead of falling through every role comparison
+        handler = _DATA_DISPATCH.get(role)
+        return handler(self, index) if handler else None
 
-        mod = self._mods[index.row()]
+    def _display_data(self, index: QModelIndex):
+        row = index.row()
+        if not index.isValid() or row >= len(self._mods):
+            return None
         col = index.column()
+        getter = _DISPLAY_GETTERS[col] if col < len(_DISPLAY_GETTERS) else None
+        return getter(self._mods[row]) if getter else None
 
-        if role == Qt.ItemDataRole.DisplayRole:
-            if col == COLUMN_MOD_ID:
-                return mod.mod_id
-            if col == COLUMN_WORKSHOP_ID:
-                return mod.workshop_id
-            if col == COLUMN_NAME:
-                return mod.name
+    def _check_data(self, index: QModelIndex):
+        row = index.row()
+        if (
+            not index.isValid()
+            or row >= len(self._mods)
+            or index.column() != COLUMN_ENABLED
+        ):
             return None
+        return _CHECKED if self._mods[row].enabled else _UNCHECKED
 
-        if role == Qt.ItemDataRole.CheckStateRole and col == COLUMN_ENABLED:
-            return Qt.CheckState.Checked if mod.enabled else Qt.CheckState.Unchecked
-
-        if role == Qt.ItemDataRole.EditRole:
-            if col == COLUMN_MOD_ID:
-                return mod.mod_id
-            if col == COLUMN_WORKSHOP_ID:
-                return mod.workshop_id
-
-        return None
+    def _edit_data(self, index: QModelIndex):
+        row = index.row()
+        if not index.isValid() or row >= len(self._mods):
+            return None
+        col = index.column()
+        getter = _EDIT_GETTERS[col] if col < len(_EDIT_GETTERS) else None
+        return getter(self._mods[row]) if getter else None
 
-    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+    def setData(self, index: QModelIndex, value, role: int = _ROLE_EDIT) -> bool:
         if not index.isValid() or index.row() >= len(self._mods):
             return False
 
         mod = self._mods[index.row()]
         col = index.column()
 
-        if role == Qt.ItemDataRole.CheckStateRole and col == COLUMN_ENABLED:
-            mod.enabled = (value.value if hasattr(value, "value") else value) == Qt.CheckState.Checked.value
+        if role == _ROLE_CHECK and col == COLUMN_ENABLED:
+            was_enabled = mod.enabled
+            mod.enabled = (value.value if hasattr(value, "value") else value) == _CHECKED_VALUE
+            if mod.enabled != was_enabled:
+                self._enabled_count += 1 if mod.enabled else -1
             self.dataChanged.emit(index, index, [role])
             return True
 
-        if role == Qt.ItemDataRole.EditRole:
+        if role == _ROLE_EDIT:
             if col == COLUMN_MOD_ID:
                 mod.mod_id = str(value)
+                self._search_blobs[index.row()] = _search_blob(mod)
                 self.dataChanged.emit(index, index, [role])
                 return True
             if col == COLUMN_WORKSHOP_ID:
                 mod.workshop_id = str(value)
+                self._search_blobs[index.row()] = _search_blob(mod)
+                self._rebuild_wid_index()
                 self.dataChanged.emit(index, index, [role])
                 return True
 
@@ -90,9 +165,9 @@ class ModListModel(QAbstractTableModel):
 
         col = index.column()
         if col == COLUMN_ENABLED:
-            return base | Qt.ItemFlag.ItemIsUserCheckable
+            return base | _FLAG_CHECKABLE
         if col in (COLUMN_MOD_ID, COLUMN_WORKSHOP_ID):
-            return base | Qt.ItemFlag.ItemIsEditable
+            return base | _FLAG_EDITABLE
         return base
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
@@ -105,21 +180,50 @@ class ModListModel(QAbstractTableModel):
         row = len(self._mods)
         self.beginInsertRows(QModelIndex(), row, row)
         self._mods.append(mod)
+        if mod.enabled:
+            self._enabled_count += 1
+        self._search_blobs.append(_search_blob(mod))
+        if mod.workshop_id:
+            self._wid_index.setdefault(mod.workshop_id, []).append(row)
         self.endInsertRows()
 
     def remove_rows(self, rows: list[int]) -> None:
-        for row in sorted(rows, reverse=True):
-            if 0 <= row < len(self._mods):
-                self.beginRemoveRows(QModelIndex(), row, row)
-                self._mods.pop(row)
-                self.endRemoveRows()
+        valid = sorted(
+            {row for row in rows if 0 <= row < len(self._mods)}, reverse=True
+        )
+        if not valid:
+            return
+        # Group contiguous rows so each run costs a single
+        # beginRemoveRows/endRemoveRows view invalidation
+        run_start = run_end = valid[0]
+        runs: list[tuple[int, int]] = []
+        for row in valid[1:]:
+            if row == run_start - 1:
+                run_start = row
+            else:
+                runs.append((run_start, run_end))
+                run_start = run_end = row
+        runs.append((run_start, run_end))
+
+        for start, end in runs:
+            self.beginRemoveRows(QModelIndex(), start, end)
+            self._enabled_count -= sum(
+                1 for m in self._mods[start:end + 1] if m.enabled
+            )
+            del self._mods[start:end + 1]
+            del self._search_blobs[start:end + 1]
+            self.endRemoveRows()
+        self._rebuild_wid_index()
 
     def move_up(self, row: int) -> bool:
         if row <= 0 or row >= len(self._mods):
             return False
         self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), row - 1)
         self._mods[row], self._mods[row - 1] = self._mods[row - 1], self._mods[row]
+        blobs = self._search_blobs
+        blobs[row], blobs[row - 1] = blobs[row - 1], blobs[row]
         self.endMoveRows()
+        self._rebuild_wid_index()
         return True
 
     def move_down(self, row: int) -> bool:
@@ -127,16 +231,96 @@ class ModListModel(QAbstractTableModel):
             return False
         self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), row + 2)
         self._mods[row], self._mods[row + 1] = self._mods[row + 1], self._mods[row]
+        blobs = self._search_blobs
+        blobs[row], blobs[row + 1] = blobs[row + 1], blobs[row]
         self.endMoveRows()
+        self._rebuild_wid_index()
         return True
 
+    def toggle_row(self, row: int, enabled: bool) -> None:
+        """Set one row's enabled state with a targeted dataChanged.
+
+        Single-row toggles must not round-trip through set_mods — that
+        resets the model and invalidates the proxy.
+        """
+        if not (0 <= row < len(self._mods)):
+            return
+        mod = self._mods[row]
+        if mod.enabled == enabled:
+            return
+        mod.enabled = enabled
+        self._enabled_count += 1 if enabled else -1
+        idx = self.index(row, COLUMN_ENABLED)
+        self.dataChanged.emit(idx, idx, [_ROLE_CHECK])
+
+    def set_all_enabled(self, enabled: bool) -> None:
+        """Toggle every row in place with one spanning dataChanged emit.
+
+        Bulk toggles must not go through set_mods — a model reset would
+        invalidate the proxy's whole sort/filter cache.
+        """
+        if not self._mods:
+            return
+        for mod in self._mods:
+            mod.enabled = enabled
+        self._enabled_count = len(self._mods) if enabled else 0
+        self.dataChanged.emit(
+            self.index(0, COLUMN_ENABLED),
+            self.index(len(self._mods) - 1, COLUMN_ENABLED),
+            [_ROLE_CHECK, _ROLE_DISPLAY],
+        )
+
     def enabled_mods(self) -> list[Mod]:
         return [m for m in self._mods if m.enabled]
 
+    def row_matches(self, row: int, needle: str) -> bool:
+        """Case-insensitive substring match against the row's fields.
+
+        Called by ModFilterProxy with an already-lowercased needle.
+        """
+        return needle in self._search_blobs[row]
+
     def update_mod_name(self, workshop_id: str, name: str) -> None:
         """Update the name for all mods with the given workshop_id."""
-        for row, mod in enumerate(self._mods):
-            if mod.workshop_id == workshop_id:
-                mod.name = name
-                idx = self.index(row, COLUMN_NAME)
-                self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DisplayRole])
+        matched = self._wid_index.get(workshop_id, [])
+        for row in matched:
+            mod = self._mods[row]
+            mod.name = name
+            self._search_blobs[row] = _search_blob(mod)
+        if matched:
+            # One spanning dataChanged instead of one emit per match
+            self.dataChanged.emit(
+                self.index(matched[0], COLUMN_NAME),
+                self.index(matched[-1], COLUMN_NAME),
+                [_ROLE_DISPLAY],
+            )
+
+
+class ModFilterProxy(QSortFilterProxyModel):
+    """Filter proxy that matches rows against the raw Mod fields.
+
+    The default all-columns filter stringifies every cell through
+    data() per row; asking the model directly skips the QVariant
+    boxing and per-column round trips.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+
+    def setFilterFixedString(self, pattern: str) -> None:
+        self._needle = pattern.strip().lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not self._needle:
+            return True
+        return self.sourceModel().row_matches(source_row, self._needle)
+
+
+# Bound after the class so data() resolves a role with one dict probe
+_DATA_DISPATCH = {
+    _ROLE_DISPLAY: ModListModel._display_data,
+    _ROLE_CHECK: ModListModel._check_data,
+    _ROLE_EDIT: ModListModel._edit_data,
+}
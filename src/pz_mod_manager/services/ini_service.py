@@ -6,8 +6,26 @@ import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 
-
-@dataclass
+# Compiled once — value_type is queried per-setting when populating dialogs
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?\d+\.\d+")
+
+# Min/Max/Default extraction from setting comments (read_all_settings)
+_MIN_RE = re.compile(r"Min:\s*([\d.-]+)")
+_MAX_RE = re.compile(r"Max:\s*([\d.-]+)")
+_DEFAULT_RE = re.compile(r"Default:\s*(\S+)")
+
+# Classifies a line as comment / assignment / blank in one compiled
+# match instead of several per-line string ops (read_all_settings)
+_LINE_RE = re.compile(
+    r"^\s*(?:"
+    r"#[# ]*(?P<c>.*?)"  # comment — leading '#'/spaces stripped
+    r"|(?P<k>[^#=\s][^=]*?)\s*=(?P<v>.*?)"  # key=value assignment
+    r")?\s*$"
+)
+
+
+@dataclass(slots=True)
 class IniSetting:
     key: str
     value: str
@@ -15,6 +33,10 @@ class IniSetting:
     min_val: float | None = None
     max_val: float | None = None
     default_val: str | None = None
+    # Pre-lowered filter text, filled in by the settings dialog on first
+    # build; lives here so the service-level settings cache preserves it
+    # across dialog reopens
+    search_blob: str = ""
 
     @property
     def value_type(self) -> str:
@@ -22,15 +44,17 @@ class IniSetting:
         low = self.value.lower()
         if low in ("true", "false"):
             return "bool"
-        if re.fullmatch(r"-?\d+", self.value):
+        if _INT_RE.fullmatch(self.value):
             return "int"
-        if re.fullmatch(r"-?\d+\.\d+", self.value):
+        if _FLOAT_RE.fullmatch(self.value):
             return "float"
         return "str"
 
 
 # Keys managed by the mod list — skip in the server settings dialog
-_MOD_KEYS = {"Mods", "WorkshopItems", "Map"}
+# A tuple this small beats a set: membership is a few pointer compares
+# with no hashing
+_MOD_KEYS = ("Mods", "WorkshopItems", "Map")
 
 
 class IniService:
@@ -44,6 +68,15 @@ class IniService:
     We strip the prefix on load and add it back on save.
     """
 
+    def __init__(self):
+        # Per-path line cache keyed by mtime, so back-to-back reads
+        # (read_bool for several keys, load then read_all_settings, ...)
+        # don't re-read the file. Invalidated on every write.
+        self._line_cache: dict[Path, tuple[int, list[str]]] = {}
+        # Parsed read_all_settings results, same keying — reopening the
+        # server settings dialog skips the whole parse
+        self._settings_cache: dict[Path, tuple[int, list[IniSetting]]] = {}
+
     def load(self, file_path: str | Path) -> tuple[list[str], list[str]]:
         """Parse Mods= and WorkshopItems= from the INI file.
 
@@ -56,13 +89,16 @@ class IniService:
         workshop_ids: list[str] = []
 
         for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("Mods="):
-                raw = self._parse_semicolon_list(stripped)
+            # Leading whitespace is rare in PZ INIs — only pay for
+            # lstrip when a line actually starts with it
+            if line[:1] in " \t":
+                line = line.lstrip()
+            if line.startswith("Mods="):
+                raw = self._parse_semicolon_list(line)
                 # Strip B42+ backslash prefix from each mod ID
-                mod_ids = [mid.lstrip("\\") for mid in raw]
-            elif stripped.startswith("WorkshopItems="):
-                workshop_ids = self._parse_semicolon_list(stripped)
+                mod_ids = [mid.removeprefix("\\") for mid in raw]
+            elif line.startswith("WorkshopItems="):
+                workshop_ids = self._parse_semicolon_list(line)
 
         return mod_ids, workshop_ids
 
@@ -89,11 +125,11 @@ class IniService:
         new_lines: list[str] = []
 
         for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("Mods="):
+            head = line.lstrip() if line[:1] in " \t" else line
+            if head.startswith("Mods="):
                 new_lines.append(mods_line)
                 found_mods = True
-            elif stripped.startswith("WorkshopItems="):
+            elif head.startswith("WorkshopItems="):
                 new_lines.append(workshop_line)
                 found_workshop = True
             else:
@@ -105,107 +141,97 @@ class IniService:
             new_lines.append(workshop_line)
 
         # Atomic write: write to temp file then rename
-        fd, tmp_path = tempfile.mkstemp(
-            dir=file_path.parent, suffix=".tmp", prefix=".pz_"
-        )
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                f.writelines(new_lines)
-            os.replace(tmp_path, file_path)
-        except BaseException:
-            # Clean up temp file on failure
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
-            raise
+        self._atomic_write(file_path, new_lines)
 
     def read_all_settings(self, file_path: str | Path) -> list[IniSetting]:
         """Parse all key=value pairs from the INI file with their comments."""
+        file_path = Path(file_path)
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        cached = self._settings_cache.get(file_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         lines = self._read_lines(file_path)
         settings: list[IniSetting] = []
         comment_lines: list[str] = []
 
         for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("#"):
-                comment_lines.append(stripped.lstrip("# "))
-            elif "=" in stripped and not stripped.startswith("#"):
-                key, _, value = stripped.partition("=")
-                key = key.strip()
-                if key in _MOD_KEYS:
-                    comment_lines.clear()
-                    continue
-
-                comment = " ".join(comment_lines)
+            m = _LINE_RE.match(line)
+            if m is None:
+                # Non-comment, non-assignment content resets comments
                 comment_lines.clear()
+                continue
+
+            c = m["c"]
+            if c is not None:
+                comment_lines.append(c)
+                continue
+
+            key = m["k"]
+            if key is None:
+                # Blank line — keep accumulating comments between a
+                # comment block and its key
+                continue
 
-                # Extract Min/Max/Default from comment
-                min_val = max_val = None
-                default_val = None
-                m = re.search(r"Min:\s*([\d.-]+)", comment)
+            value = m["v"]
+            if key in _MOD_KEYS:
+                comment_lines.clear()
+                continue
+
+            comment = " ".join(comment_lines)
+            comment_lines.clear()
+
+            # Extract Min/Max/Default from comment — cheap substring
+            # check first so most comments skip the regex searches
+            min_val = max_val = None
+            default_val = None
+            if "Min:" in comment or "Max:" in comment or "Default:" in comment:
+                m = _MIN_RE.search(comment)
                 if m:
                     min_val = float(m.group(1))
-                m = re.search(r"Max:\s*([\d.-]+)", comment)
+                m = _MAX_RE.search(comment)
                 if m:
                     max_val = float(m.group(1))
-                m = re.search(r"Default:\s*(\S+)", comment)
+                m = _DEFAULT_RE.search(comment)
                 if m:
                     default_val = m.group(1)
 
-                settings.append(IniSetting(
-                    key=key,
-                    value=value,
-                    comment=comment,
-                    min_val=min_val,
-                    max_val=max_val,
-                    default_val=default_val,
-                ))
-            else:
-                # Blank line or other — reset accumulated comments
-                if not stripped:
-                    pass  # keep accumulating across blanks between comment and key
-                else:
-                    comment_lines.clear()
+            settings.append(IniSetting(
+                key=key,
+                value=value,
+                comment=comment,
+                min_val=min_val,
+                max_val=max_val,
+                default_val=default_val,
+            ))
 
+        self._settings_cache[file_path] = (mtime_ns, settings)
         return settings
 
     def write_settings(self, file_path: str | Path, changes: dict[str, str]) -> None:
         """Write changed key=value pairs back to the INI file."""
         file_path = Path(file_path)
         lines = self._read_lines(file_path)
-        new_lines: list[str] = []
+        index = self._key_index(lines)
+        new_lines = list(lines)
 
-        for line in lines:
-            stripped = line.strip()
-            if "=" in stripped and not stripped.startswith("#"):
-                key, _, _ = stripped.partition("=")
-                key = key.strip()
-                if key in changes:
-                    new_lines.append(f"{key}={changes[key]}\n")
-                    continue
-            new_lines.append(line)
+        for key, value in changes.items():
+            idx = index.get(key)
+            if idx is not None:
+                new_lines[idx] = f"{key}={value}\n"
 
-        fd, tmp_path = tempfile.mkstemp(
-            dir=file_path.parent, suffix=".tmp", prefix=".pz_"
-        )
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                f.writelines(new_lines)
-            os.replace(tmp_path, file_path)
-        except BaseException:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
-            raise
+        self._atomic_write(file_path, new_lines)
 
     def read_bool(self, file_path: str | Path, key: str, default: bool = False) -> bool:
         """Read a boolean key=value from the INI file."""
-        for line in self._read_lines(file_path):
+        prefix = f"{key}="
+        for line in self._iter_lines(file_path):
             stripped = line.strip()
-            if stripped.startswith(f"{key}="):
-                _, _, value = stripped.partition("=")
+            if stripped.startswith(prefix):
+                value = stripped.partition("=")[2]
                 return value.strip().lower() == "true"
         return default
 
@@ -214,19 +240,63 @@ class IniService:
         file_path = Path(file_path)
         lines = self._read_lines(file_path)
         new_value = "true" if value else "false"
-        found = False
-        new_lines: list[str] = []
+        idx = self._key_index(lines).get(key)
+        new_lines = list(lines)
 
-        for line in lines:
-            if line.strip().startswith(f"{key}="):
-                new_lines.append(f"{key}={new_value}\n")
-                found = True
-            else:
-                new_lines.append(line)
-
-        if not found:
+        if idx is not None:
+            new_lines[idx] = f"{key}={new_value}\n"
+        else:
             new_lines.append(f"{key}={new_value}\n")
 
+        self._atomic_write(file_path, new_lines)
+
+    def _read_lines(self, file_path: str | Path) -> list[str]:
+        file_path = Path(file_path)
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        cached = self._line_cache.get(file_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        with open(file_path, encoding="utf-8") as f:
+            lines = f.readlines()
+        self._line_cache[file_path] = (mtime_ns, lines)
+        return lines
+
+    def _iter_lines(self, file_path: str | Path):
+        """Yield lines lazily, serving from the cache when it's fresh.
+
+        Lets single-key lookups short-circuit without materializing the
+        whole file on a cold read.
+        """
+        file_path = Path(file_path)
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        cached = self._line_cache.get(file_path)
+        if cached is not None and cached[0] == mtime_ns:
+            yield from cached[1]
+            return
+        with open(file_path, encoding="utf-8") as f:
+            yield from f
+
+    def _invalidate_cache(self, file_path: Path) -> None:
+        self._line_cache.pop(file_path, None)
+        self._settings_cache.pop(file_path, None)
+
+    def _atomic_write(self, file_path: Path, new_lines: list[str]) -> None:
+        """Atomically replace the file with new_lines (temp file + rename).
+
+        Skips the write entirely when the content is unchanged, so
+        toggle-and-save cycles that end up back where they started
+        don't touch the disk.
+        """
+        cached = self._line_cache.get(file_path)
+        if cached is not None and cached[1] == new_lines:
+            return
+
         fd, tmp_path = tempfile.mkstemp(
             dir=file_path.parent, suffix=".tmp", prefix=".pz_"
         )
@@ -234,16 +304,30 @@ class IniService:
             with os.fdopen(fd, "w", encoding="utf-8") as f:
                 f.writelines(new_lines)
             os.replace(tmp_path, file_path)
+            self._invalidate_cache(file_path)
         except BaseException:
+            # Clean up temp file on failure
             try:
                 os.unlink(tmp_path)
             except OSError:
                 pass
             raise
 
-    def _read_lines(self, file_path: str | Path) -> list[str]:
-        with open(file_path, encoding="utf-8") as f:
-            return f.readlines()
+    @staticmethod
+    def _key_index(lines: list[str]) -> dict[str, int]:
+        """Map each key to its line index, in one pass over the file.
+
+        Keyed updates and lookups then become O(1) instead of
+        rescanning every line per key.
+        """
+        index: dict[str, int] = {}
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if "=" in stripped and not stripped.startswith("#"):
+                key = stripped.partition("=")[0].strip()
+                if key and key not in index:
+                    index[key] = i
+        return index
 
     def _parse_semicolon_list(self, line: str) -> list[str]:
         """Split 'Key=val1;val2;val3' into ['val1', 'val2', 'val3'].
@@ -252,11 +336,12 @@ class IniService:
         correspondence between Mods= and WorkshopItems= lists.
         Only strips trailing empty entries (caused by trailing semicolons).
         """
-        _, _, value = line.partition("=")
-        if not value or not value.strip(";\\ "):
+        eq = line.find("=")
+        if eq < 0:
+            return []
+        # rstrip before split drops trailing whitespace and trailing
+        # empties (from trailing semicolons) while keeping internal ones
+        tail = line[eq + 1:].rstrip().rstrip(";")
+        if not tail or not tail.strip(";\\ "):
             return []
-        items = value.split(";")
-        # Strip trailing empties (from trailing semicolons) but keep internal ones
-        while items and not items[-1]:
-            items.pop()
-        return items
+        return tail.split(";")
@@ -8,39 +8,62 @@ from pz_mod_manager.utils.constants import APP_NAME
 class SettingsService:
     def __init__(self):
         self._settings = QSettings(APP_NAME, APP_NAME)
+        # Memoized values — QSettings reads go through a mutex-protected
+        # backend, and hot paths (e.g. api_key per fetch) read repeatedly.
+        # Setters keep the cache in sync.
+        self._cache: dict[str, object] = {}
 
     @property
     def api_key(self) -> str:
-        return self._settings.value("steam_api_key", "", type=str)
+        if "steam_api_key" not in self._cache:
+            self._cache["steam_api_key"] = self._settings.value(
+                "steam_api_key", "", type=str
+            )
+        return self._cache["steam_api_key"]
 
     @api_key.setter
     def api_key(self, value: str) -> None:
         self._settings.setValue("steam_api_key", value)
+        self._cache["steam_api_key"] = value
 
     @property
     def last_ini_path(self) -> str:
-        return self._settings.value("last_ini_path", "", type=str)
+        if "last_ini_path" not in self._cache:
+            self._cache["last_ini_path"] = self._settings.value(
+                "last_ini_path", "", type=str
+            )
+        return self._cache["last_ini_path"]
 
     @last_ini_path.setter
     def last_ini_path(self, value: str) -> None:
         self._settings.setValue("last_ini_path", value)
+        self._cache["last_ini_path"] = value
 
     @property
     def recent_files(self) -> list[str]:
-        val = self._settings.value("recent_files", [], type=list)
-        return val if isinstance(val, list) else []
+        if "recent_files" not in self._cache:
+            val = self._settings.value("recent_files", [], type=list)
+            self._cache["recent_files"] = val if isinstance(val, list) else []
+        return list(self._cache["recent_files"])
 
     @property
     def workshop_path(self) -> str:
-        return self._settings.value("workshop_path", "", type=str)
+        if "workshop_path" not in self._cache:
+            self._cache["workshop_path"] = self._settings.value(
+                "workshop_path", "", type=str
+            )
+        return self._cache["workshop_path"]
 
     @workshop_path.setter
     def workshop_path(self, value: str) -> None:
         self._settings.setValue("workshop_path", value)
+        self._cache["workshop_path"] = value
 
     def add_recent_file(self, path: str, max_items: int = 10) -> None:
         files = self.recent_files
         if path in files:
             files.remove(path)
         files.insert(0, path)
-        self._settings.setValue("recent_files", files[:max_items])
+        files = files[:max_items]
+        self._settings.setValue("recent_files", files)
+        self._cache["recent_files"] = files
@@ -1,6 +1,20 @@
 from __future__ import annotations
 
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    # Rust-based parser, ~2x faster than stdlib on the larger search
+    # responses; optional via the "speed" extra
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 from pz_mod_manager.utils.constants import STEAM_WORKSHOP_PZ_APP_ID
 
@@ -9,6 +23,23 @@ class SteamApiError(Exception):
     pass
 
 
+# Steam's documented per-request item limit for GetDetails
+_BATCH_SIZE = 100
+
+# The PZ tag list changes on the order of weeks — serve it from a local
+# cache and revalidate at most once a day
+_TAG_CACHE_TTL = 24 * 60 * 60
+
+# String fields copied verbatim from each QueryFiles search result
+_SEARCH_FIELDS = (
+    "publishedfileid",
+    "title",
+    "short_description",
+    "file_description",
+    "preview_url",
+)
+
+
 class SteamApiService:
     API_URL = "https://api.steampowered.com/IPublishedFileService/GetDetails/v1/"
     QUERY_URL = "https://api.steampowered.com/IPublishedFileService/QueryFiles/v1/"
@@ -16,41 +47,91 @@ class SteamApiService:
 
     def __init__(self, api_key: str):
         self._api_key = api_key
+        # Persistent session — keep-alive reuses the TLS connection
+        # across calls instead of re-handshaking per request.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                ),
+            ),
+        )
+        # Explicit — Steam's JSON is highly compressible and urllib3
+        # decompresses transparently on read
+        self._session.headers.update({"Accept-Encoding": "gzip, deflate"})
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._session.close()
 
     def fetch_mod_details(self, workshop_ids: list[str]) -> list[dict]:
         """Batch fetch details for multiple workshop IDs.
 
+        Requests are chunked to Steam's 100-items-per-call limit and sent
+        over one pooled connection.
+
         Returns a list of dicts with keys:
             publishedfileid, title, file_description, preview_url
         Only includes items that were found (result == 1).
         """
-        if not workshop_ids:
-            return []
+        results = []
+        for start in range(0, len(workshop_ids), _BATCH_SIZE):
+            batch = workshop_ids[start:start + _BATCH_SIZE]
+            params: dict[str, str] = {"key": self._api_key}
+            for i, wid in enumerate(batch):
+                params[f"publishedfileids[{i}]"] = wid
 
-        params: dict[str, str] = {"key": self._api_key}
-        for i, wid in enumerate(workshop_ids):
-            params[f"publishedfileids[{i}]"] = wid
+            try:
+                resp = self._session.get(self.API_URL, params=params, timeout=15)
+                resp.raise_for_status()
+            except requests.RequestException as e:
+                raise SteamApiError(f"Steam API request failed: {e}") from e
 
-        try:
-            resp = requests.get(self.API_URL, params=params, timeout=15)
-            resp.raise_for_status()
-        except requests.RequestException as e:
-            raise SteamApiError(f"Steam API request failed: {e}") from e
+            data = _loads(resp.content)
+            details = data.get("response", {}).get("publishedfiledetails", [])
 
-        data = resp.json()
-        details = data.get("response", {}).get("publishedfiledetails", [])
+            for item in details:
+                if item.get("result") == 1:
+                    results.append(
+                        {
+                            "publishedfileid": item.get("publishedfileid", ""),
+                            "title": item.get("title", ""),
+                            "file_description": item.get("file_description", ""),
+                            "preview_url": item.get("preview_url", ""),
+                        }
+                    )
+        return results
 
-        results = []
-        for item in details:
-            if item.get("result") == 1:
-                results.append(
-                    {
-                        "publishedfileid": item.get("publishedfileid", ""),
-                        "title": item.get("title", ""),
-                        "file_description": item.get("file_description", ""),
-                        "preview_url": item.get("preview_url", ""),
-                    }
-                )
+    def fetch_mod_details_bulk(
+        self,
+        workshop_ids: list[str],
+        chunk_size: int = _BATCH_SIZE,
+        max_workers: int = 8,
+    ) -> list[dict]:
+        """Fetch details for a large ID list with concurrent batched calls.
+
+        Splits workshop_ids into chunk_size batches and issues them in
+        parallel over the pooled session, so a multi-hundred-mod library
+        costs roughly one round-trip instead of one per batch.
+        Result order follows the input chunk order.
+        """
+        if len(workshop_ids) <= chunk_size:
+            return self.fetch_mod_details(workshop_ids)
+
+        chunks = [
+            workshop_ids[i:i + chunk_size]
+            for i in range(0, len(workshop_ids), chunk_size)
+        ]
+        results: list[dict] = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as ex:
+            for chunk_results in ex.map(self.fetch_mod_details, chunks):
+                results.extend(chunk_results)
         return results
 
     def fetch_single_mod(self, workshop_id: str) -> dict | None:
@@ -58,6 +139,15 @@ class SteamApiService:
         results = self.fetch_mod_details([workshop_id])
         return results[0] if results else None
 
+    def fetch_full_description(self, workshop_id: str) -> str:
+        """Fetch the full BBCode description for one workshop item.
+
+        search_mods only returns short descriptions; call this when the
+        detail view actually needs the full text.
+        """
+        detail = self.fetch_single_mod(workshop_id)
+        return detail.get("file_description", "") if detail else ""
+
     def search_mods(
         self,
         text: str,
@@ -80,7 +170,12 @@ class SteamApiService:
             "query_type": "12",
             "search_text": text,
             "appid": STEAM_WORKSHOP_PZ_APP_ID,
+            # return_details populates title/preview_url/subscriptions;
+            # the short-description flag additionally gives us a cheap
+            # summary so the multi-KB file_description can be rendered
+            # lazily on selection
             "return_details": "true",
+            "return_short_description": "true",
             "return_tags": "true",
             "numperpage": str(num_per_page),
             "page": str(page),
@@ -90,47 +185,98 @@ class SteamApiService:
                 params[f"requiredtags[{i}]"] = tag
 
         try:
-            resp = requests.get(self.QUERY_URL, params=params, timeout=15)
+            resp = self._session.get(self.QUERY_URL, params=params, timeout=15)
             resp.raise_for_status()
         except requests.RequestException as e:
             raise SteamApiError(f"Steam API request failed: {e}") from e
 
-        response = resp.json().get("response", {})
+        response = _loads(resp.content).get("response", {})
         total = int(response.get("total", 0))
         raw_items = response.get("publishedfiledetails", [])
 
-        results = []
-        for item in raw_items:
-            tag_list = [t["tag"] for t in item.get("tags", []) if "tag" in t]
-            results.append({
-                "publishedfileid": item.get("publishedfileid", ""),
-                "title": item.get("title", ""),
-                "short_description": item.get("short_description", ""),
-                "file_description": item.get("file_description", ""),
-                "preview_url": item.get("preview_url", ""),
-                "tags": tag_list,
+        results = [
+            {f: item.get(f, "") for f in _SEARCH_FIELDS}
+            | {
+                "tags": [t["tag"] for t in item.get("tags", ()) if "tag" in t],
                 "subscriptions": int(item.get("subscriptions", 0)),
-            })
+            }
+            for item in raw_items
+        ]
 
         return {"total": total, "results": results}
 
     def fetch_tags(self) -> list[str]:
         """Fetch available Steam Workshop tags for PZ, sorted by popularity.
 
+        Served from an on-disk cache while fresh (24h TTL); otherwise
+        revalidated with a conditional GET when the server gave an ETag.
+
         Returns a list of tag name strings.
         Raises SteamApiError on failure.
         """
+        cache_path = self._tag_cache_path()
+        etag_path = cache_path.with_suffix(".etag")
+
+        headers: dict[str, str] = {}
+        if cache_path.is_file():
+            try:
+                if time.time() - cache_path.stat().st_mtime < _TAG_CACHE_TTL:
+                    return _loads(cache_path.read_bytes())
+                etag = etag_path.read_text(encoding="utf-8").strip()
+                if etag:
+                    headers["If-None-Match"] = etag
+            except (OSError, ValueError):
+                pass
+
         params = {
             "key": self._api_key,
             "appid": STEAM_WORKSHOP_PZ_APP_ID,
             "language": "english",
         }
         try:
-            resp = requests.get(self.TAG_LIST_URL, params=params, timeout=15)
-            resp.raise_for_status()
+            resp = self._session.get(
+                self.TAG_LIST_URL,
+                params=params,
+                headers=headers,
+                timeout=15,
+                stream=True,
+            )
+            try:
+                if resp.status_code == 304 and cache_path.is_file():
+                    # Unchanged — refresh the TTL and serve the cached copy
+                    try:
+                        cached_tags = _loads(cache_path.read_bytes())
+                    except (OSError, ValueError) as e:
+                        # Corrupt cache on a bodyless 304 — surface as an
+                        # API error so callers fall back gracefully
+                        raise SteamApiError(f"Corrupt tag cache: {e}") from e
+                    os.utime(cache_path)
+                    return cached_tags
+                resp.raise_for_status()
+                # The streamed response is read once here (no second
+                # copy); resp.content keeps requests' error wrapping,
+                # unlike resp.raw.read which leaks urllib3 exceptions
+                body = resp.content
+            finally:
+                resp.close()
         except requests.RequestException as e:
             raise SteamApiError(f"Steam API request failed: {e}") from e
 
-        tags = resp.json().get("response", {}).get("tags", [])
+        tags = _loads(body).get("response", {}).get("tags", [])
         tags.sort(key=lambda t: int(t.get("count", 0)), reverse=True)
-        return [t["tag"] for t in tags if "tag" in t]
+        names = [t["tag"] for t in tags if "tag" in t]
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(json.dumps(names).encode("utf-8"))
+            etag = resp.headers.get("ETag", "")
+            if etag:
+                etag_path.write_text(etag, encoding="utf-8")
+        except OSError:
+            pass  # caching is best-effort
+
+        return names
+
+    @staticmethod
+    def _tag_cache_path() -> Path:
+        return Path.home() / ".cache" / "pz_mod_manager" / "tags.json"
@@ -1,13 +1,35 @@
 from __future__ import annotations
 
+import os
 import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 PZ_APP_ID = "108600"
 
+# Pulls id= and name= out of a mod.info in one C-level pass over the
+# text instead of per-line Python string ops
+_KV_RE = re.compile(r"^\s*(id|name)\s*=\s*(.*?)\s*$", re.MULTILINE)
 
-@dataclass
+# Workshop item dirs are ASCII decimal IDs; the regex ASCII fast path
+# beats str.isdigit's Unicode category scan in the hot outer loop
+_DIGITS_RE = re.compile(r"\A[0-9]+\Z")
+
+# mod.info keys sit in the first few lines; read in small chunks and
+# stop early instead of decoding entire files with long metadata blocks
+_INFO_CHUNK_SIZE = 4096
+_INFO_MAX_BYTES = 65536
+
+# Scan results keyed by content dir path -> (mtime_ns, results).
+# Steam bumps the dir mtime on subscribe/unsubscribe, so a matching
+# mtime means the tree is unchanged and the walk can be skipped.
+_scan_cache: dict[str, tuple[int, list[WorkshopModInfo]]] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class WorkshopModInfo:
     """A single mod found inside a workshop item's directory."""
 
@@ -16,51 +38,101 @@ class WorkshopModInfo:
     workshop_id: str
 
 
-def scan_workshop_content(workshop_path: Path) -> list[WorkshopModInfo]:
-    """Scan a Steam workshop content directory for PZ mod.info files.
+def iter_workshop_content(
+    workshop_path: Path, force: bool = False
+) -> Iterator[WorkshopModInfo]:
+    """Lazily yield PZ mods found under a Steam workshop content directory.
+
+    Mods are yielded as the directory walk progresses, so dict-building
+    consumers overlap their work with the traversal instead of waiting
+    for a full list. The completed result set is cached by the content
+    dir's mtime for subsequent calls.
 
     Args:
         workshop_path: Path to the workshop content root, e.g.
             /path/to/workshop-mods/content/108600/
             or /path/to/workshop-mods/ (will look for content/108600/ inside)
+        force: Bypass the mtime cache and rescan the tree. The content
+            dir's mtime doesn't change when Steam rewrites files inside
+            an existing item, so user-triggered rescans should force.
+    """
+    content_dir = _resolve_content_dir(workshop_path)
+    if content_dir is None or not content_dir.is_dir():
+        return
+
+    cache_key = str(content_dir)
+    try:
+        mtime_ns = content_dir.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    if not force:
+        cached = _scan_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            yield from cached[1]
+            return
+
+    # os.scandir serves is_dir() from the directory enumeration itself,
+    # skipping the extra stat() per entry that Path.is_dir() costs
+    with os.scandir(content_dir) as it:
+        item_dirs = [
+            Path(entry.path)
+            for entry in it
+            if _DIGITS_RE.match(entry.name) and entry.is_dir(follow_symlinks=False)
+        ]
+
+    # Each workshop item's subtree is independent and the work is
+    # stat/read syscalls, so threads overlap the I/O nicely
+    results: list[WorkshopModInfo] = []
+    if item_dirs:
+        max_workers = min(16, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            for found in ex.map(_scan_item, item_dirs):
+                results.extend(found)
+                yield from found
+
+    # Only reached when the walk ran to completion
+    _scan_cache[cache_key] = (mtime_ns, results)
+
+
+def scan_workshop_content(
+    workshop_path: Path, force: bool = False
+) -> list[WorkshopModInfo]:
+    """Scan a Steam workshop content directory for PZ mod.info files.
 
     Returns:
         List of WorkshopModInfo with the mod_id, name, and workshop_id for
         every mod found across all workshop items.
     """
-    content_dir = _resolve_content_dir(workshop_path)
-    if content_dir is None or not content_dir.is_dir():
-        return []
+    return list(iter_workshop_content(workshop_path, force=force))
 
-    results: list[WorkshopModInfo] = []
 
-    for item_dir in content_dir.iterdir():
-        if not item_dir.is_dir() or not item_dir.name.isdigit():
-            continue
-        workshop_id = item_dir.name
-        mods_dir = item_dir / "mods"
-        if not mods_dir.is_dir():
-            continue
+def _scan_item(item_dir: Path) -> list[WorkshopModInfo]:
+    """Scan one workshop item directory for its mod.info files."""
+    workshop_id = item_dir.name
+    mods_dir = item_dir / "mods"
+    if not mods_dir.is_dir():
+        return []
 
-        for mod_dir in mods_dir.iterdir():
-            if not mod_dir.is_dir():
+    found: list[WorkshopModInfo] = []
+    with os.scandir(mods_dir) as it:
+        for entry in it:
+            if not entry.is_dir(follow_symlinks=False):
                 continue
-            info = _find_best_mod_info(mod_dir)
+            info = _find_best_mod_info(Path(entry.path))
             if info:
                 mod_id, name = info
-                results.append(
+                found.append(
                     WorkshopModInfo(
                         mod_id=mod_id,
                         name=name,
                         workshop_id=workshop_id,
                     )
                 )
-
-    return results
+    return found
 
 
 def build_mod_id_to_workshop_map(
-    mods: list[WorkshopModInfo],
+    mods: Iterable[WorkshopModInfo],
 ) -> dict[str, str]:
     """Build a mapping of mod_id -> workshop_id from scan results."""
     return {m.mod_id: m.workshop_id for m in mods}
@@ -88,13 +160,14 @@ def extract_mod_id_from_description(text: str) -> str | None:
 
 
 def build_workshop_to_mod_ids_map(
-    mods: list[WorkshopModInfo],
+    mods: Iterable[WorkshopModInfo],
 ) -> dict[str, list[str]]:
     """Build a mapping of workshop_id -> [mod_id, ...] from scan results."""
-    result: dict[str, list[str]] = {}
+    # defaultdict avoids setdefault's throwaway empty-list argument
+    result: defaultdict[str, list[str]] = defaultdict(list)
     for m in mods:
-        result.setdefault(m.workshop_id, []).append(m.mod_id)
-    return result
+        result[m.workshop_id].append(m.mod_id)
+    return dict(result)
 
 
 def _resolve_content_dir(path: Path) -> Path | None:
@@ -122,50 +195,67 @@ def _find_best_mod_info(mod_dir: Path) -> tuple[str, str] | None:
 
     Returns (mod_id, name) or None if no valid mod.info found.
     """
-    # Collect all mod.info files
-    info_files: list[tuple[str, Path]] = []
+    versioned: list[tuple[str, Path]] = []
+    with os.scandir(mod_dir) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                sub_info = Path(entry.path) / "mod.info"
+                if sub_info.is_file():
+                    versioned.append((entry.name, sub_info))
+
+    # Highest-versioned subdir wins; only stat the root mod.info when
+    # there are no versioned ones
+    if versioned:
+        _, best_file = max(versioned, key=lambda x: _version_key(x[0]))
+        return _parse_mod_info(best_file)
+
     root_info = mod_dir / "mod.info"
     if root_info.is_file():
-        info_files.append(("", root_info))
-
-    for subdir in mod_dir.iterdir():
-        if subdir.is_dir():
-            sub_info = subdir / "mod.info"
-            if sub_info.is_file():
-                info_files.append((subdir.name, sub_info))
+        return _parse_mod_info(root_info)
+    return None
 
-    if not info_files:
-        return None
 
-    # Prefer versioned dirs (sorted descending) over root
-    info_files.sort(key=lambda x: x[0], reverse=True)
-    # Pick the first versioned one, or root if no versioned dirs
-    _, best_file = info_files[0] if info_files[0][0] else info_files[-1]
-    # Actually prefer highest version
-    for version_name, path in info_files:
-        if version_name:  # has a version dir
-            best_file = path
-            break
+def _version_key(name: str) -> tuple[int, ...]:
+    """Numeric sort key for version directory names.
 
-    return _parse_mod_info(best_file)
+    String comparison would rank "42.13" below "42.2"; comparing tuples
+    of ints gets B42-style versions right.
+    """
+    return tuple(int(p) for p in name.split(".") if p.isdigit())
 
 
 def _parse_mod_info(info_path: Path) -> tuple[str, str] | None:
-    """Parse a mod.info file and extract id= and name= values."""
+    """Parse a mod.info file and extract id= and name= values.
+
+    Reads in small chunks and stops as soon as both keys are found, so
+    only the head of the file is decoded in the common case.
+    """
+    kv: dict[str, str] = {}
+    buf = bytearray()
     try:
-        text = info_path.read_text(encoding="utf-8", errors="replace")
+        with info_path.open("rb") as f:
+            while len(buf) < _INFO_MAX_BYTES:
+                chunk = f.read(_INFO_CHUNK_SIZE)
+                if not chunk:
+                    # EOF — scan whatever is left (possibly no trailing
+                    # newline on the final line)
+                    for m in _KV_RE.finditer(bytes(buf).decode("utf-8", "replace")):
+                        kv.setdefault(m.group(1), m.group(2))
+                    break
+                buf += chunk
+                # Only scan up to the last complete line so a key=value
+                # split across the chunk boundary isn't truncated
+                nl = buf.rfind(b"\n")
+                if nl < 0:
+                    continue
+                for m in _KV_RE.finditer(bytes(buf[:nl]).decode("utf-8", "replace")):
+                    kv.setdefault(m.group(1), m.group(2))
+                if "id" in kv and "name" in kv:
+                    break
     except OSError:
         return None
 
-    mod_id = ""
-    name = ""
-    for line in text.splitlines():
-        line = line.strip()
-        if line.startswith("id="):
-            mod_id = line.partition("=")[2].strip()
-        elif line.startswith("name="):
-            name = line.partition("=")[2].strip()
-
+    mod_id = kv.get("id", "")
     if mod_id:
-        return mod_id, name
+        return mod_id, kv.get("name", "")
     return None
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import re
 
+# Compiled once — this runs on every keystroke in the Add Mod dialog
+_WORKSHOP_ID_RE = re.compile(r"[?&]id=(\d+)")
+
 
 def extract_workshop_id(input_text: str) -> str | None:
     """Extract a numeric Steam Workshop ID from various input formats.
@@ -11,16 +14,23 @@ def extract_workshop_id(input_text: str) -> str | None:
         - Full URL: "https://steamcommunity.com/sharedfiles/filedetails/?id=2875848298"
         - URL with extra params: "...?id=2875848298&searchtext=zomboid"
     """
-    text = input_text.strip()
-    if not text:
+    # Most pastes have no padding — skip the strip allocation unless
+    # the first or last char is actually whitespace
+    if not input_text:
         return None
+    if input_text[0].isspace() or input_text[-1].isspace():
+        text = input_text.strip()
+        if not text:
+            return None
+    else:
+        text = input_text
 
-    # Plain numeric ID
-    if text.isdigit():
+    # Plain numeric ID (length-gated so long pastes skip the digit scan)
+    if len(text) <= 20 and text.isdigit():
         return text
 
     # URL with ?id=DIGITS parameter
-    match = re.search(r"[?&]id=(\d+)", text)
+    match = _WORKSHOP_ID_RE.search(text)
     if match:
         return match.group(1)
 
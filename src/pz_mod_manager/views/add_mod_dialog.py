@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -17,6 +17,29 @@ from pz_mod_manager.services.steam_api_service import SteamApiError, SteamApiSer
 from pz_mod_manager.utils.url_parser import extract_workshop_id
 
 
+class _FetchSignals(QObject):
+    finished = Signal(object)  # dict | None
+    error = Signal(str)
+
+
+class _FetchWorker(QRunnable):
+    """Fetches mod details on the global thread pool so the dialog's
+    event loop keeps pumping during the Steam round-trip."""
+
+    def __init__(self, api_service: SteamApiService, workshop_id: str):
+        super().__init__()
+        self._api_service = api_service
+        self._workshop_id = workshop_id
+        self.signals = _FetchSignals()
+
+    def run(self):
+        try:
+            result = self._api_service.fetch_single_mod(self._workshop_id)
+            self.signals.finished.emit(result)
+        except SteamApiError as e:
+            self.signals.error.emit(str(e))
+
+
 class AddModDialog(QDialog):
     def __init__(self, api_service: SteamApiService | None, parent=None):
         super().__init__(parent)
@@ -24,6 +47,14 @@ class AddModDialog(QDialog):
         self._mod: Mod | None = None
         self.setWindowTitle("Add Mod")
         self.setMinimumWidth(500)
+
+        # Coalesce bursty textChanged fires (typing, paste) into one
+        # extract_workshop_id run after the input settles
+        self._url_debounce = QTimer(self)
+        self._url_debounce.setSingleShot(True)
+        self._url_debounce.setInterval(50)
+        self._url_debounce.timeout.connect(self._flush_url)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -84,8 +115,11 @@ class AddModDialog(QDialog):
         self._url_edit.textChanged.connect(self._on_url_changed)
 
     def _on_url_changed(self, text: str):
-        wid = extract_workshop_id(text)
-        if wid:
+        self._url_debounce.start()
+
+    def _flush_url(self):
+        wid = extract_workshop_id(self._url_edit.text())
+        if wid and wid != self._workshop_id_edit.text():
             self._workshop_id_edit.setText(wid)
 
     def _on_fetch(self):
@@ -97,17 +131,29 @@ class AddModDialog(QDialog):
         if not self._api_service:
             return
 
-        try:
-            result = self._api_service.fetch_single_mod(wid)
-        except SteamApiError as e:
-            QMessageBox.critical(self, "API Error", str(e))
-            return
+        self._fetch_btn.setEnabled(False)
+        self._fetch_btn.setText("Fetching...")
+        self._fetch_worker = _FetchWorker(self._api_service, wid)
+        self._fetch_worker.signals.finished.connect(self._on_fetch_done)
+        self._fetch_worker.signals.error.connect(self._on_fetch_error)
+        QThreadPool.globalInstance().start(self._fetch_worker)
 
+    def _on_fetch_done(self, result: dict | None):
+        self._reset_fetch_button()
         if result:
             self._name_edit.setText(result.get("title", ""))
         else:
+            wid = self._workshop_id_edit.text().strip()
             QMessageBox.warning(self, "Not Found", f"No workshop item found for ID {wid}.")
 
+    def _on_fetch_error(self, msg: str):
+        self._reset_fetch_button()
+        QMessageBox.critical(self, "API Error", msg)
+
+    def _reset_fetch_button(self):
+        self._fetch_btn.setText("Fetch Details")
+        self._fetch_btn.setEnabled(True)
+
     def _on_accept(self):
         mod_id = self._mod_id_edit.text().strip()
         workshop_id = self._workshop_id_edit.text().strip()
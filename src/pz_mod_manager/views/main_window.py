@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 import webbrowser
 from pathlib import Path
 
-from PySide6.QtCore import QSortFilterProxyModel, Qt, QThread, Signal, QObject
+try:
+    # Optional "speed" extra — much faster sidecar parse/serialize and
+    # skips the UTF-8 decode/encode round trip
+    import orjson
+except ImportError:
+    orjson = None
+
+from PySide6.QtCore import QRunnable, Qt, QThreadPool, QTimer, Signal, QObject
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QApplication,
@@ -23,7 +32,7 @@ from PySide6.QtWidgets import (
 )
 
 from pz_mod_manager.models.mod import Mod
-from pz_mod_manager.models.mod_list_model import ModListModel
+from pz_mod_manager.models.mod_list_model import ModFilterProxy, ModListModel
 from pz_mod_manager.services.ini_service import IniService
 from pz_mod_manager.services.settings_service import SettingsService
 from pz_mod_manager.services.steam_api_service import SteamApiError, SteamApiService
@@ -36,24 +45,93 @@ from pz_mod_manager.services.workshop_scanner import (
 from pz_mod_manager.utils.constants import COLUMN_WORKSHOP_ID
 
 
-class _FetchNamesWorker(QObject):
+# Workshop IDs per name-fetch batch (Steam's GetDetails cap)
+_NAME_BATCH_SIZE = 100
+
+
+def _dedup(items) -> list[str]:
+    """Order-preserving dedup that also drops falsy entries.
+
+    Cheaper than dict.fromkeys for large lists — a bare set tracks
+    membership without the dict's value slots.
+    """
+    seen: set[str] = set()
+    out: list[str] = []
+    add = seen.add
+    append = out.append
+    for item in items:
+        if item and item not in seen:
+            add(item)
+            append(item)
+    return out
+
+
+class _FetchNamesSignals(QObject):
     finished = Signal(list)  # list of dicts from Steam API
     error = Signal(str)
 
+
+class _FetchNamesBatch(QRunnable):
+    """One batched GetDetails call; batches run concurrently on the
+    global thread pool and merge incrementally as each finishes."""
+
     def __init__(self, api_service: SteamApiService, workshop_ids: list[str]):
         super().__init__()
         self._api_service = api_service
         self._workshop_ids = workshop_ids
+        self.signals = _FetchNamesSignals()
 
     def run(self):
         try:
             results = self._api_service.fetch_mod_details(self._workshop_ids)
-            self.finished.emit(results)
+            self.signals.finished.emit(results)
         except SteamApiError as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+
+class _SaveSidecarWorker(QRunnable):
+    """Serializes and writes the sidecar JSON off the GUI thread.
+
+    Runs on a single-thread pool so writes to the same path stay in
+    submission order, and replaces the file atomically so a concurrent
+    load never observes a half-written sidecar.
+    """
+
+    def __init__(self, path: Path, disabled: list[dict]):
+        super().__init__()
+        self._path = path
+        self._disabled = disabled
+
+    def run(self):
+        try:
+            if self._disabled:
+                payload = {"disabled_mods": self._disabled}
+                if orjson is not None:
+                    data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(payload, indent=2).encode("utf-8")
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self._path.parent, suffix=".tmp", prefix=".pz_"
+                )
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(data)
+                    os.replace(tmp_path, self._path)
+                except BaseException:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                    raise
+            elif self._path.exists():
+                self._path.unlink()
+        except OSError:
+            pass  # best-effort; the INI itself saved fine
 
 
 class MainWindow(QMainWindow):
+    _INI_FILTER = "INI Files (*.ini);;All Files (*)"
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PZ Mod Manager")
@@ -63,13 +141,22 @@ class MainWindow(QMainWindow):
         self._settings = SettingsService()
         self._current_file: str | None = None
         self._dirty = False
-        self._worker_thread: QThread | None = None
+        self._updating = False  # suppress per-signal status recomputes
+        self._name_batches: list[_FetchNamesBatch] = []
+        # Dedicated one-thread pool so sidecar writes can't reorder
+        self._sidecar_pool = QThreadPool(self)
+        self._sidecar_pool.setMaxThreadCount(1)
 
         self._model = ModListModel(self)
-        self._proxy = QSortFilterProxyModel(self)
+        self._proxy = ModFilterProxy(self)
         self._proxy.setSourceModel(self._model)
-        self._proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self._proxy.setFilterKeyColumn(-1)  # search all columns
+
+        # Debounce filter-as-you-type: each refilter is a full O(rows)
+        # scan, so only run it once typing pauses
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
 
         self._setup_ui()
         self._setup_menu()
@@ -185,7 +272,7 @@ class MainWindow(QMainWindow):
         self._act_refresh = toolbar.addAction("Refresh Names")
 
     def _setup_connections(self):
-        self._search_edit.textChanged.connect(self._proxy.setFilterFixedString)
+        self._search_edit.textChanged.connect(self._on_filter_text_changed)
         self._act_open.triggered.connect(self._on_open)
         self._act_save.triggered.connect(self._on_save)
         self._act_save_as.triggered.connect(self._on_save_as)
@@ -208,6 +295,12 @@ class MainWindow(QMainWindow):
         self._model.rowsInserted.connect(self._on_data_changed)
         self._model.rowsRemoved.connect(self._on_data_changed)
 
+    def _on_filter_text_changed(self, text: str):
+        self._filter_timer.start()
+
+    def _apply_filter(self):
+        self._proxy.setFilterFixedString(self._search_edit.text())
+
     # ── File Operations ───────────────────────────────────────
 
     def _on_open(self):
@@ -215,7 +308,7 @@ class MainWindow(QMainWindow):
             return
         start_dir = self._settings.last_ini_path or ""
         path, _ = QFileDialog.getOpenFileName(
-            self, "Open Server INI", start_dir, "INI Files (*.ini);;All Files (*)"
+            self, "Open Server INI", start_dir, self._INI_FILTER
         )
         if path:
             self._load_file(path)
@@ -230,23 +323,35 @@ class MainWindow(QMainWindow):
         # Load disabled mods from sidecar
         disabled_mods = self._load_sidecar(path)
 
-        # Try to resolve correct pairings via workshop scanner
-        mod_to_ws = self._get_workshop_mapping()
+        # Try to resolve correct pairings via workshop scanner — one
+        # scan feeds both lookup maps
+        scan_results = self._scan_workshop()
+        mod_to_ws = build_mod_id_to_workshop_map(scan_results)
 
         mods: list[Mod] = []
         if mod_to_ws:
             # Scanner available - use it for correct pairings
-            ws_to_mods = build_workshop_to_mod_ids_map(
-                scan_workshop_content(Path(self._settings.workshop_path))
-            )
+            ws_to_mods = build_workshop_to_mod_ids_map(scan_results)
+            # Fallback lookup for IDs with backslash escapes removed
+            # (PZ INI sometimes escapes & as \&) — computed once instead
+            # of a str.replace per mod inside the loop
+            clean_map = {
+                k.replace("\\", ""): v
+                for k, v in mod_to_ws.items()
+                if "\\" in k
+            }
+            # Bind loop invariants once — attribute resolution per mod
+            # adds up on large lists
+            append = mods.append
+            get_ws = mod_to_ws.get
+            get_clean = clean_map.get
             for mid in mod_ids:
-                # Try exact match, then try with backslash escapes removed
-                # (PZ INI sometimes escapes & as \&)
-                wid = mod_to_ws.get(mid, "")
-                if not wid:
-                    clean_mid = mid.replace("\\", "")
-                    wid = mod_to_ws.get(clean_mid, "")
-                mods.append(Mod(mod_id=mid, workshop_id=wid, enabled=True))
+                wid = get_ws(mid) or get_clean(mid, "")
+                if not wid and "\\" in mid:
+                    # Only pay the replace when the ID actually has an
+                    # escape to strip
+                    wid = get_ws(mid.replace("\\", ""), "")
+                append(Mod(mod_id=mid, workshop_id=wid, enabled=True))
             # Add any workshop IDs not accounted for by the mods
             # (e.g. library/dependency workshop items, or mods not in the Mods= list)
             used_ws = {m.workshop_id for m in mods if m.workshop_id}
@@ -293,7 +398,11 @@ class MainWindow(QMainWindow):
                 )
             )
 
+        # Suspend sorting for the bulk populate so the proxy doesn't
+        # re-sort thousands of rows mid-reset
+        self._table.setSortingEnabled(False)
         self._model.set_mods(mods)
+        self._table.setSortingEnabled(True)
         self._current_file = path
         self._dirty = False
         self._settings.last_ini_path = path
@@ -314,7 +423,7 @@ class MainWindow(QMainWindow):
     def _on_save_as(self):
         start_dir = self._current_file or ""
         path, _ = QFileDialog.getSaveFileName(
-            self, "Save Server INI", start_dir, "INI Files (*.ini);;All Files (*)"
+            self, "Save Server INI", start_dir, self._INI_FILTER
         )
         if path:
             self._save_file(path)
@@ -334,9 +443,7 @@ class MainWindow(QMainWindow):
         mod_ids = [m.mod_id for m in enabled if m.mod_id]
         # Workshop IDs are an independent list - deduplicate and filter empties
         # (a single workshop item can provide multiple mods)
-        workshop_ids = list(dict.fromkeys(
-            m.workshop_id for m in enabled if m.workshop_id
-        ))
+        workshop_ids = _dedup(m.workshop_id for m in enabled)
 
         try:
             # If file doesn't exist yet (Save As to new location), create minimal content
@@ -366,9 +473,15 @@ class MainWindow(QMainWindow):
         sp = self._sidecar_path(ini_path)
         if sp.exists():
             try:
-                data = json.loads(sp.read_text(encoding="utf-8"))
+                if orjson is not None:
+                    data = orjson.loads(sp.read_bytes())
+                else:
+                    # json.load streams from the fd, skipping the
+                    # intermediate full-file string
+                    with sp.open("rb") as f:
+                        data = json.load(f)
                 return data.get("disabled_mods", [])
-            except (json.JSONDecodeError, KeyError):
+            except (ValueError, KeyError):
                 return []
         return []
 
@@ -378,14 +491,10 @@ class MainWindow(QMainWindow):
             for m in self._model.mods
             if not m.enabled
         ]
-        sp = self._sidecar_path(ini_path)
-        if disabled:
-            sp.write_text(
-                json.dumps({"disabled_mods": disabled}, indent=2),
-                encoding="utf-8",
-            )
-        elif sp.exists():
-            sp.unlink()
+        self._sidecar_worker = _SaveSidecarWorker(
+            self._sidecar_path(ini_path), disabled
+        )
+        self._sidecar_pool.start(self._sidecar_worker)
 
     # ── Mod Operations ────────────────────────────────────────
 
@@ -414,18 +523,12 @@ class MainWindow(QMainWindow):
         self._model.remove_rows(source_rows)
 
     def _on_enable_all(self):
-        mods = self._model.mods
-        for mod in mods:
-            mod.enabled = True
-        self._model.set_mods(mods)
+        self._model.set_all_enabled(True)
         self._dirty = True
         self._update_status()
 
     def _on_disable_all(self):
-        mods = self._model.mods
-        for mod in mods:
-            mod.enabled = False
-        self._model.set_mods(mods)
+        self._model.set_all_enabled(False)
         self._dirty = True
         self._update_status()
 
@@ -452,24 +555,19 @@ class MainWindow(QMainWindow):
 
     def _on_copy_docker_workshop(self):
         enabled = self._model.enabled_mods()
-        workshop_ids = list(dict.fromkeys(
-            m.workshop_id for m in enabled if m.workshop_id
-        ))
+        workshop_ids = _dedup(m.workshop_id for m in enabled)
         text = ";".join(workshop_ids)
         QApplication.clipboard().setText(text)
         self.statusBar().showMessage(f"Copied {len(workshop_ids)} workshop IDs for Docker", 3000)
 
     # ── Workshop Scanner ───────────────────────────────────────
 
-    def _get_workshop_mapping(self) -> dict[str, str]:
-        """Return mod_id -> workshop_id mapping from scanner, or empty dict."""
+    def _scan_workshop(self) -> list:
+        """Scan the configured workshop path, or [] when unset."""
         ws_path = self._settings.workshop_path
         if not ws_path:
-            return {}
-        results = scan_workshop_content(Path(ws_path))
-        if not results:
-            return {}
-        return build_mod_id_to_workshop_map(results)
+            return []
+        return scan_workshop_content(Path(ws_path))
 
     def _on_scan_workshop(self):
         ws_path = self._settings.workshop_path
@@ -483,7 +581,9 @@ class MainWindow(QMainWindow):
             )
             return
 
-        results = scan_workshop_content(Path(ws_path))
+        # Explicit rescan — bypass the mtime cache, which can't see
+        # updates inside existing item dirs
+        results = scan_workshop_content(Path(ws_path), force=True)
         if not results:
             QMessageBox.warning(
                 self,
@@ -493,15 +593,16 @@ class MainWindow(QMainWindow):
             )
             return
 
-        mod_to_ws = build_mod_id_to_workshop_map(results)
         ws_to_mods = build_workshop_to_mod_ids_map(results)
+        # One dict build instead of a linear scan of results per mod
+        by_mod_id = {r.mod_id: r for r in results}
 
         # Update workshop IDs and names for existing mods in the model
         mods = self._model.mods
         updated = 0
         for mod in mods:
-            if mod.mod_id and mod.mod_id in mod_to_ws:
-                info = next(r for r in results if r.mod_id == mod.mod_id)
+            info = by_mod_id.get(mod.mod_id) if mod.mod_id else None
+            if info is not None:
                 if mod.workshop_id != info.workshop_id or not mod.name:
                     mod.workshop_id = info.workshop_id
                     if info.name:
@@ -566,25 +667,28 @@ class MainWindow(QMainWindow):
             return
 
         api_service = SteamApiService(self._settings.api_key)
-        self._worker = _FetchNamesWorker(api_service, workshop_ids)
-        self._worker_thread = QThread()
-        self._worker.moveToThread(self._worker_thread)
-        self._worker_thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._on_names_fetched)
-        self._worker.error.connect(self._on_names_error)
-        self._worker.finished.connect(self._worker_thread.quit)
-        self._worker.error.connect(self._worker_thread.quit)
-
+        # Keep worker refs alive until their signals have fired
+        self._name_batches = []
+        pool = QThreadPool.globalInstance()
         self.statusBar().showMessage("Fetching mod names from Steam...")
-        self._worker_thread.start()
+        for start in range(0, len(workshop_ids), _NAME_BATCH_SIZE):
+            worker = _FetchNamesBatch(
+                api_service, workshop_ids[start:start + _NAME_BATCH_SIZE]
+            )
+            worker.signals.finished.connect(self._on_names_fetched)
+            worker.signals.error.connect(self._on_names_error)
+            self._name_batches.append(worker)
+            pool.start(worker)
 
     def _on_names_fetched(self, results: list[dict]):
         was_dirty = self._dirty
+        self._updating = True
         for item in results:
             wid = item.get("publishedfileid", "")
             title = item.get("title", "")
             if wid and title:
                 self._model.update_mod_name(wid, title)
+        self._updating = False
         self._dirty = was_dirty
         self._update_status()
         self.statusBar().showMessage(f"Updated {len(results)} mod name(s)", 3000)
@@ -615,6 +719,7 @@ class MainWindow(QMainWindow):
         dialog = SearchWorkshopDialog(api_service, ws_to_mods, self)
         dialog.mod_selected.connect(self._on_mod_from_search)
         dialog.exec()
+        api_service.close()
 
     def _on_mod_from_search(self, mod: Mod):
         self._model.add_mod(mod)
@@ -675,19 +780,15 @@ class MainWindow(QMainWindow):
         mod = mods[row]
 
         if action == act_enable:
-            mod.enabled = True
-            self._model.set_mods(mods)
+            self._model.toggle_row(row, True)
             self._dirty = True
         elif action == act_disable:
-            mod.enabled = False
-            self._model.set_mods(mods)
+            self._model.toggle_row(row, False)
             self._dirty = True
         elif action == act_remove:
             self._model.remove_rows([row])
         elif action == act_open_ws and mod.workshop_id:
-            webbrowser.open(
-                f"https://steamcommunity.com/sharedfiles/filedetails/?id={mod.workshop_id}"
-            )
+            webbrowser.open(mod.workshop_url)
         elif action == act_fetch_id:
             self._fetch_mod_id_from_workshop(mods, row)
 
@@ -733,7 +834,8 @@ class MainWindow(QMainWindow):
 
     def _on_data_changed(self):
         self._dirty = True
-        self._update_status()
+        if not self._updating:
+            self._update_status()
 
     def _update_status(self):
         if self._current_file:
@@ -744,9 +846,9 @@ class MainWindow(QMainWindow):
             self._status_file.setText("No file loaded")
             self.setWindowTitle("PZ Mod Manager")
 
-        all_mods = self._model.mods
-        enabled = sum(1 for m in all_mods if m.enabled)
-        self._status_count.setText(f"{len(all_mods)} mods ({enabled} enabled)")
+        count = self._model.rowCount()
+        enabled = self._model.enabled_count
+        self._status_count.setText(f"{count} mods ({enabled} enabled)")
 
     def _check_unsaved(self) -> bool:
         """Returns True if it's OK to proceed (no unsaved changes or user chose to discard)."""
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
 import re
+from collections import OrderedDict
+from functools import lru_cache
 
 import requests
 
-from PySide6.QtCore import QObject, QThread, Qt, QTimer, Signal
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    QThread,
+    QThreadPool,
+    Qt,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import QDesktopServices, QPixmap
 from PySide6.QtWidgets import (
     QComboBox,
@@ -26,6 +36,15 @@ from pz_mod_manager.models.mod import Mod
 from pz_mod_manager.services.steam_api_service import SteamApiError, SteamApiService
 from pz_mod_manager.services.workshop_scanner import extract_mod_id_from_description
 
+# Shared keep-alive session for preview downloads — successive previews
+# reuse the TLS connection to Steam's image CDN instead of
+# re-handshaking per click.
+_HTTP = requests.Session()
+_HTTP.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8),
+)
+
 # Known PZ workshop tags — used when the Steam tag API is unavailable.
 _FALLBACK_TAGS = [
     "Build 42",
@@ -65,81 +84,89 @@ _BB_SIMPLE: list[tuple[str, str]] = [
     ("td", "td"),
 ]
 
+# Every pattern compiled once at import — _bbcode_to_html runs on each
+# result selection, and per-call compile-cache lookups add up
+_RE_URL_LABEL = re.compile(r"\[url=([^\]]+)\](.*?)\[/url\]", re.IGNORECASE | re.DOTALL)
+_RE_URL = re.compile(r"\[url\](.*?)\[/url\]", re.IGNORECASE | re.DOTALL)
+_RE_IMG = re.compile(r"\[img\](.*?)\[/img\]", re.IGNORECASE | re.DOTALL)
+_RE_NOPARSE = re.compile(r"\[noparse\](.*?)\[/noparse\]", re.IGNORECASE | re.DOTALL)
+_RE_SPOILER = re.compile(r"\[spoiler\](.*?)\[/spoiler\]", re.IGNORECASE | re.DOTALL)
+_RE_UNKNOWN_TAG = re.compile(r"\[/?[a-zA-Z][^\]]*\]")
+
+# Single C-level passes instead of chained .replace() scans
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_NEWLINE_TO_BR_TABLE = str.maketrans({"\r": "<br>", "\n": "<br>"})
+
+
+def _build_bb_union() -> tuple[re.Pattern[str], dict[str, str]]:
+    """Fuse every literal tag rewrite into one alternation.
+
+    One scan and one output buffer instead of ~20 full-text re.sub
+    passes, each of which would allocate an intermediate string.
+    """
+    rules: list[tuple[str, str, str]] = []
+    for i, (bb, html) in enumerate(_BB_SIMPLE):
+        rules.append((f"o{i}", rf"\[{bb}\]", f"<{html}>"))
+        rules.append((f"c{i}", rf"\[/{bb}\]", f"</{html}>"))
+    rules += [
+        ("quoteu", r"\[quote=[^\]]+\]", "<blockquote>"),
+        ("quote", r"\[quote\]", "<blockquote>"),
+        ("quotec", r"\[/quote\]", "</blockquote>"),
+        ("list", r"\[list\]", "<ul>"),
+        ("listc", r"\[/list\]", "</ul>"),
+        ("olist", r"\[olist\]", "<ol>"),
+        ("olistc", r"\[/olist\]", "</ol>"),
+        ("li", r"\[\*\]", "<li>"),
+        ("hr", r"\[hr\]", "<hr>"),
+    ]
+    pattern = re.compile(
+        "|".join(f"(?P<{name}>{pat})" for name, pat, _ in rules), re.IGNORECASE
+    )
+    return pattern, {name: repl for name, _, repl in rules}
 
 
-def _bbcode_to_html(text: str) -> str:
-    """Convert Steam Workshop BBCode markup to HTML for display in QTextBrowser."""
-    # Escape HTML entities first so literal < > & in descriptions survive.
-    text = text.replace("&", "&amp;")
-    text = text.replace("<", "&lt;")
-    text = text.replace(">", "&gt;")
+_BB_UNION_RE, _BB_UNION_REPL = _build_bb_union()
 
-    # Simple open/close paired tags.
-    for bb, html in _BB_SIMPLE:
-        text = re.sub(rf"\[{bb}\]", f"<{html}>", text, flags=re.IGNORECASE)
-        text = re.sub(rf"\[/{bb}\]", f"</{html}>", text, flags=re.IGNORECASE)
 
-    # [url=link]label[/url]
-    text = re.sub(
-        r"\[url=([^\]]+)\](.*?)\[/url\]",
-        r'<a href="\1">\2</a>',
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-    # [url]link[/url]
-    text = re.sub(
-        r"\[url\](.*?)\[/url\]",
-        r'<a href="\1">\1</a>',
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+def _bb_union_sub(m: re.Match[str]) -> str:
+    return _BB_UNION_REPL[m.lastgroup]
 
-    # [img]url[/img] — show as a clickable placeholder rather than loading inline.
-    text = re.sub(
-        r"\[img\](.*?)\[/img\]",
-        r'<a href="\1">[image]</a>',
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
 
-    # [quote] / [quote=user]
-    text = re.sub(r"\[quote=[^\]]+\]", "<blockquote>", text, flags=re.IGNORECASE)
-    text = re.sub(r"\[quote\]", "<blockquote>", text, flags=re.IGNORECASE)
-    text = re.sub(r"\[/quote\]", "</blockquote>", text, flags=re.IGNORECASE)
+@lru_cache(maxsize=256)
+def _bbcode_to_html(text: str) -> str:
+    """Convert Steam Workshop BBCode markup to HTML for display in QTextBrowser.
 
-    # Lists
-    text = re.sub(r"\[list\]", "<ul>", text, flags=re.IGNORECASE)
-    text = re.sub(r"\[/list\]", "</ul>", text, flags=re.IGNORECASE)
-    text = re.sub(r"\[olist\]", "<ol>", text, flags=re.IGNORECASE)
-    text = re.sub(r"\[/olist\]", "</ol>", text, flags=re.IGNORECASE)
-    text = re.sub(r"\[\*\]", "<li>", text, flags=re.IGNORECASE)
+    Memoized — re-selecting a result renders the same description again,
+    and descriptions are immutable strings.
+    """
+    # Escape HTML entities first so literal < > & in descriptions survive.
+    text = text.translate(_HTML_ESCAPE_TABLE)
 
-    # [hr]
-    text = re.sub(r"\[hr\]", "<hr>", text, flags=re.IGNORECASE)
+    # Fast path: many descriptions contain no BBCode at all
+    if "[" not in text:
+        return text.replace("\r\n", "\n").translate(_NEWLINE_TO_BR_TABLE)
 
+    # Content-capturing tags first, in their original relative order.
+    # [url=link]label[/url]
+    text = _RE_URL_LABEL.sub(r'<a href="\1">\2</a>', text)
+    # [url]link[/url]
+    text = _RE_URL.sub(r'<a href="\1">\1</a>', text)
+    # [img]url[/img] — show as a clickable placeholder rather than loading inline.
+    text = _RE_IMG.sub(r'<a href="\1">[image]</a>', text)
     # [noparse]...[/noparse] — content is already HTML-escaped above; just unwrap.
-    text = re.sub(
-        r"\[noparse\](.*?)\[/noparse\]",
-        r"\1",
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-
+    text = _RE_NOPARSE.sub(r"\1", text)
     # [spoiler]...[/spoiler]
-    text = re.sub(
-        r"\[spoiler\](.*?)\[/spoiler\]",
-        r"<i>\1</i>",
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    text = _RE_SPOILER.sub(r"<i>\1</i>", text)
 
-    # Strip any remaining unknown [tags].
-    text = re.sub(r"\[/?[a-zA-Z][^\]]*\]", "", text)
+    # All literal tag rewrites (simple pairs, quotes, lists, [hr]) in
+    # one fused pass.
+    text = _BB_UNION_RE.sub(_bb_union_sub, text)
 
-    # Newlines → <br>.
-    text = text.replace("\r\n", "<br>").replace("\r", "<br>").replace("\n", "<br>")
+    # Strip any remaining unknown [tags].
+    text = _RE_UNKNOWN_TAG.sub("", text)
 
-    return text
+    # Newlines → <br> (collapse CRLF first so it maps to a single break).
+    return text.replace("\r\n", "\n").translate(_NEWLINE_TO_BR_TABLE)
 
 
 class _FetchTagsWorker(QObject):
@@ -182,26 +209,68 @@ class _SearchWorker(QObject):
                 tags=self._tags or None,
                 page=self._page,
             )
+            # Convert descriptions here so the regex work overlaps the
+            # network wait instead of blocking the UI thread
+            for item in result["results"]:
+                item["_html_desc"] = _bbcode_to_html(
+                    item.get("file_description")
+                    or item.get("short_description")
+                    or "(No description)"
+                )
+                item["_display"] = (
+                    f"{item['title']}\n{item['subscriptions']:,} subscribers"
+                )
             self.finished.emit(result)
         except SteamApiError as e:
             self.error.emit(str(e))
 
 
-class _FetchImageWorker(QObject):
+class _FetchDescSignals(QObject):
+    finished = Signal(str, str)  # raw BBCode, converted HTML
+    error = Signal(str)
+
+
+class _FetchDescWorker(QRunnable):
+    """Full-description fetch on the global thread pool — no per-click
+    QThread lifetime to manage; stale results are dropped via the
+    generation token."""
+
+    def __init__(self, api_service: SteamApiService, workshop_id: str):
+        super().__init__()
+        self._api_service = api_service
+        self._workshop_id = workshop_id
+        self.signals = _FetchDescSignals()
+
+    def run(self):
+        try:
+            desc = self._api_service.fetch_full_description(self._workshop_id)
+            html = _bbcode_to_html(desc) if desc else ""
+            self.signals.finished.emit(desc, html)
+        except SteamApiError as e:
+            self.signals.error.emit(str(e))
+
+
+class _FetchImageSignals(QObject):
     finished = Signal(bytes)
     error = Signal(str)
 
+
+class _FetchImageWorker(QRunnable):
+    """Preview download on the global thread pool — no per-click QThread
+    construction, and stale results are dropped via the generation token."""
+
     def __init__(self, url: str):
         super().__init__()
         self._url = url
+        self.signals = _FetchImageSignals()
 
     def run(self):
         try:
-            resp = requests.get(self._url, timeout=10)
+            resp = _HTTP.get(self._url, timeout=10)
             resp.raise_for_status()
-            self.finished.emit(resp.content)
+            self.signals.finished.emit(resp.content)
         except requests.RequestException as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class SearchWorkshopDialog(QDialog):
@@ -220,17 +289,28 @@ class SearchWorkshopDialog(QDialog):
         self._total_results = 0
         self._results: list[dict] = []
         self._selected_item: dict | None = None
+        self._selected_raw_desc = ""
         self._image_generation = 0
+        # Decoded previews keyed by URL (LRU) — revisiting a result
+        # skips the HTTPS fetch and JPEG decode entirely
+        self._pixmap_cache: OrderedDict[str, QPixmap] = OrderedDict()
+        self._pixmap_cache_max = 64
 
         self._worker: _FetchTagsWorker | None = None
         self._worker_thread: QThread | None = None
         self._search_worker: _SearchWorker | None = None
         self._search_thread: QThread | None = None
         self._image_worker: _FetchImageWorker | None = None
-        self._image_thread: QThread | None = None
-        # Old image threads are kept here until they finish to prevent
-        # "Destroyed while thread is still running" crashes.
-        self._old_image_threads: list[QThread] = []
+        self._desc_worker: _FetchDescWorker | None = None
+        self._desc_generation = 0
+
+        # Coalesce rapid arrow-key navigation: only the settled
+        # selection pays for the HTML render and image fetch
+        self._pending_item: QListWidgetItem | None = None
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(80)
+        self._select_timer.timeout.connect(self._apply_selection)
 
         self.setWindowTitle("Search Steam Workshop")
         self.setMinimumSize(900, 650)
@@ -403,12 +483,17 @@ class SearchWorkshopDialog(QDialog):
         new_items = result["results"]
         self._results.extend(new_items)
 
-        for item in new_items:
-            subs = item["subscriptions"]
-            display = f"{item['title']}\n{subs:,} subscribers"
-            list_item = QListWidgetItem(display)
-            list_item.setData(Qt.ItemDataRole.UserRole, item)
-            self._results_list.addItem(list_item)
+        # One relayout for the whole page instead of one per inserted item
+        self._results_list.setUpdatesEnabled(False)
+        self._results_list.blockSignals(True)
+        try:
+            for item in new_items:
+                list_item = QListWidgetItem(item["_display"])
+                list_item.setData(Qt.ItemDataRole.UserRole, item)
+                self._results_list.addItem(list_item)
+        finally:
+            self._results_list.blockSignals(False)
+            self._results_list.setUpdatesEnabled(True)
 
         loaded = len(self._results)
         self._status_label.setText(
@@ -428,14 +513,23 @@ class SearchWorkshopDialog(QDialog):
     def _on_result_selected(
         self, current: QListWidgetItem, previous: QListWidgetItem
     ):
+        self._pending_item = current
+        self._select_timer.start()
+
+    def _apply_selection(self):
+        current = self._pending_item
         if current is None:
             self._selected_item = None
+            self._selected_raw_desc = ""
             self._clear_detail()
             self._update_add_button_state()
             return
 
         item = current.data(Qt.ItemDataRole.UserRole)
         self._selected_item = item
+        self._selected_raw_desc = (
+            item.get("file_description") or item.get("short_description") or ""
+        )
 
         self._title_label.setText(f"<b>{item['title']}</b>")
         tags_text = ", ".join(item.get("tags", [])) or "No tags"
@@ -443,12 +537,19 @@ class SearchWorkshopDialog(QDialog):
         subs = item.get("subscriptions", 0)
         self._subs_label.setText(f"{subs:,} subscribers")
 
-        desc = (
-            item.get("file_description")
-            or item.get("short_description")
-            or "(No description)"
-        )
-        self._desc_browser.setHtml(_bbcode_to_html(desc))
+        # Show the cached short-description HTML immediately; the full
+        # BBCode description is fetched lazily since search omits it
+        html = item.get("_html_desc")
+        if html is None:
+            html = _bbcode_to_html(
+                item.get("file_description")
+                or item.get("short_description")
+                or "(No description)"
+            )
+            item["_html_desc"] = html
+        self._desc_browser.setHtml(html)
+        if not item.get("file_description"):
+            self._fetch_description_async(item)
 
         preview_url = item.get("preview_url", "")
         self._preview_label.clear()
@@ -471,50 +572,72 @@ class SearchWorkshopDialog(QDialog):
     def _update_add_button_state(self):
         self._add_btn.setEnabled(self._selected_item is not None)
 
+    # ── Description Fetching ──────────────────────────────────
+
+    def _fetch_description_async(self, item: dict):
+        self._desc_generation += 1
+        gen = self._desc_generation
+
+        self._desc_worker = _FetchDescWorker(
+            self._api_service, item["publishedfileid"]
+        )
+        self._desc_worker.signals.finished.connect(
+            lambda desc, html, g=gen, i=item: self._on_description_fetched(
+                desc, html, g, i
+            )
+        )
+        QThreadPool.globalInstance().start(self._desc_worker)
+
+    def _on_description_fetched(
+        self, desc: str, html: str, generation: int, item: dict
+    ):
+        # Cache on the result dict so re-selecting doesn't refetch
+        item["file_description"] = desc
+        if item is self._selected_item and desc:
+            self._selected_raw_desc = desc
+        if desc:
+            item["_html_desc"] = html
+        if generation != self._desc_generation or not desc:
+            return
+        self._desc_browser.setHtml(html)
+
     # ── Image Fetching ────────────────────────────────────────
 
     def _fetch_image_async(self, url: str):
         self._image_generation += 1
         gen = self._image_generation
 
-        # Retire the previous thread into the holding list so Python doesn't
-        # GC it while it's still running.  It will remove itself when done.
-        if self._image_thread is not None:
-            old = self._image_thread
-            if old.isRunning():
-                self._old_image_threads.append(old)
-                old.finished.connect(
-                    lambda t=old: self._old_image_threads.remove(t)
-                    if t in self._old_image_threads
-                    else None
-                )
+        cached = self._pixmap_cache.get(url)
+        if cached is not None:
+            self._pixmap_cache.move_to_end(url)
+            self._preview_label.setPixmap(cached)
+            return
 
         self._image_worker = _FetchImageWorker(url)
-        self._image_thread = QThread()
-        self._image_worker.moveToThread(self._image_thread)
-        self._image_thread.started.connect(self._image_worker.run)
-        self._image_worker.finished.connect(
-            lambda data, g=gen: self._on_image_fetched(data, g)
+        self._image_worker.signals.finished.connect(
+            lambda data, g=gen, u=url: self._on_image_fetched(data, g, u)
         )
-        self._image_worker.error.connect(
+        self._image_worker.signals.error.connect(
             lambda _, g=gen: self._on_image_error(g)
         )
-        self._image_worker.finished.connect(self._image_thread.quit)
-        self._image_worker.error.connect(self._image_thread.quit)
-        self._image_thread.start()
+        QThreadPool.globalInstance().start(self._image_worker)
 
-    def _on_image_fetched(self, data: bytes, generation: int):
-        if generation != self._image_generation:
-            return
+    def _on_image_fetched(self, data: bytes, generation: int, url: str):
         pixmap = QPixmap()
         if pixmap.loadFromData(data):
+            # The preview label is fixed-size, so cache the scaled
+            # result — hits skip the smooth resample, not just the fetch
             scaled = pixmap.scaled(
                 self._preview_label.size(),
                 Qt.AspectRatioMode.KeepAspectRatio,
                 Qt.TransformationMode.SmoothTransformation,
             )
-            self._preview_label.setPixmap(scaled)
-        else:
+            self._pixmap_cache[url] = scaled
+            if len(self._pixmap_cache) > self._pixmap_cache_max:
+                self._pixmap_cache.popitem(last=False)
+            if generation == self._image_generation:
+                self._preview_label.setPixmap(scaled)
+        elif generation == self._image_generation:
             self._preview_label.setText("No preview")
 
     def _on_image_error(self, generation: int):
@@ -535,13 +658,9 @@ class SearchWorkshopDialog(QDialog):
         mod_id = local_ids[0] if local_ids else ""
         hint_source = "local"
 
-        # 2. Fall back to parsing the description.
+        # 2. Fall back to parsing the description stashed at selection.
         if not mod_id:
-            raw_desc = (
-                self._selected_item.get("file_description", "")
-                or self._selected_item.get("short_description", "")
-            )
-            mod_id = extract_mod_id_from_description(raw_desc) or ""
+            mod_id = extract_mod_id_from_description(self._selected_raw_desc) or ""
             hint_source = "description" if mod_id else "none"
 
         mod = Mod(
@@ -578,8 +697,6 @@ class SearchWorkshopDialog(QDialog):
         threads = [
             self._worker_thread,
             self._search_thread,
-            self._image_thread,
-            *self._old_image_threads,
         ]
         for thread in threads:
             if thread and thread.isRunning():
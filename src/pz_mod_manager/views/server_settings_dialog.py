@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
-from PySide6.QtCore import QSettings, Qt
+from PySide6.QtCore import QPoint, QSettings, Qt, QTimer
 from PySide6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -21,6 +22,23 @@ from PySide6.QtWidgets import (
 from pz_mod_manager.services.ini_service import IniService, IniSetting
 from pz_mod_manager.utils.constants import APP_NAME
 
+# CamelCase splitter for _key_to_label, compiled once — both word
+# boundaries in a single alternation so the key is walked one time
+_CAMEL_SPLIT = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+# Strips the Min/Max/Default annotations out of setting descriptions
+_COMMENT_META_RE = re.compile(r"\s*(?:Min|Max|Default):\s*\S+")
+
+
+@lru_cache(maxsize=512)
+def _key_to_label(key: str) -> str:
+    """Convert CamelCase key to a readable label.
+
+    Memoized — each key is converted twice per dialog build (title and
+    search text) and again on every reopen, from a bounded key set.
+    """
+    return _CAMEL_SPLIT.sub(" ", key)
+
 
 class ServerSettingsDialog(QDialog):
     def __init__(self, ini_service: IniService, file_path: str, parent=None):
@@ -30,7 +48,29 @@ class ServerSettingsDialog(QDialog):
         self._widgets: dict[str, QWidget] = {}
         self._original: dict[str, str] = {}
         self._cards: list[tuple[QFrame, str]] = []  # (card, searchable_text)
+        # Input widgets are realized lazily as their cards scroll into
+        # view; until then a card holds (placeholder label, setting)
+        self._pending: dict[str, tuple[QLabel, IniSetting, QFrame]] = {}
+        # Keys whose widget emitted a change signal — save only needs
+        # to re-read these instead of every widget
+        self._dirty_keys: set[str] = set()
         self._qsettings = QSettings(APP_NAME, APP_NAME)
+        # Exact-type dispatch — one dict probe per widget on save
+        # instead of a chain of isinstance checks
+        self._value_getters = {
+            QCheckBox: lambda w: "true" if w.isChecked() else "false",
+            QSpinBox: lambda w: str(w.value()),
+            QDoubleSpinBox: self._format_double,
+            QLineEdit: lambda w: w.text(),
+        }
+
+        self._last_needle = ""
+        # Debounce filtering: re-walking every card per keystroke
+        # thrashes Qt layout for intermediate needles
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(80)
+        self._filter_timer.timeout.connect(self._apply_filter)
 
         self.setWindowTitle("Server Settings")
         self.setMinimumSize(650, 500)
@@ -57,27 +97,49 @@ class ServerSettingsDialog(QDialog):
         cards_layout.setSpacing(8)
         cards_layout.setContentsMargins(4, 4, 4, 4)
 
+        # One layout/paint pass for the whole card stack instead of an
+        # invalidation per addWidget
+        self.setUpdatesEnabled(False)
         for setting in settings:
             self._original[setting.key] = setting.value
-            widget = self._create_widget(setting)
-            self._widgets[setting.key] = widget
 
             desc = ""
-            if setting.comment:
-                desc = re.sub(
-                    r"\s*(?:Min|Max|Default):\s*\S+", "", setting.comment
-                ).strip().rstrip(".")
-
-            card = self._build_card(setting, widget, desc)
+            comment = setting.comment
+            if comment:
+                # Only engage the regex when a marker is present
+                if "Min:" in comment or "Max:" in comment or "Default:" in comment:
+                    comment = _COMMENT_META_RE.sub("", comment)
+                desc = comment.strip().rstrip(".")
+
+            # Cheap placeholder instead of a real input widget — the
+            # editor is built only once the card scrolls into view
+            placeholder = QLabel(setting.value)
+            placeholder.setObjectName("hintLabel")
+            card = self._build_card(setting, placeholder, desc)
             cards_layout.addWidget(card)
-
-            # Build searchable text: key, readable label, and description
-            search_text = f"{setting.key} {self._key_to_label(setting.key)} {desc}".lower()
-            self._cards.append((card, search_text))
+            self._pending[setting.key] = (placeholder, setting, card)
+
+            # Searchable text: key, readable label, and description.
+            # Stored on the setting so the service's parse cache carries
+            # it across dialog reopens.
+            if not setting.search_blob:
+                setting.search_blob = " ".join((
+                    setting.key.lower(),
+                    _key_to_label(setting.key).lower(),
+                    desc.lower(),
+                ))
+            self._cards.append((card, setting.search_blob))
 
         cards_layout.addStretch()
+        self.setUpdatesEnabled(True)
         scroll.setWidget(container)
         layout.addWidget(scroll)
+        self._scroll = scroll
+        scroll.verticalScrollBar().valueChanged.connect(self._realize_visible)
+        scroll.verticalScrollBar().rangeChanged.connect(
+            lambda *_: self._realize_visible()
+        )
+        QTimer.singleShot(0, self._realize_visible)
 
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel
@@ -95,10 +157,13 @@ class ServerSettingsDialog(QDialog):
         card_layout.setSpacing(4)
 
         # Header row
-        title = QLabel(f"<b>{self._key_to_label(setting.key)}</b>")
+        title = QLabel(f"<b>{_key_to_label(setting.key)}</b>")
         title.setTextFormat(Qt.TextFormat.RichText)
 
-        if isinstance(widget, QLineEdit):
+        # Free-text settings get a full-width editor below the title;
+        # decided from the value type so the lazily realized widget
+        # lands in the same spot as its placeholder
+        if setting.value_type == "str":
             card_layout.addWidget(title)
             card_layout.addWidget(widget)
         else:
@@ -118,9 +183,49 @@ class ServerSettingsDialog(QDialog):
         return card
 
     def _on_filter(self, text: str):
-        needle = text.lower().strip()
+        self._filter_timer.start()
+
+    def _apply_filter(self):
+        needle = self._search_edit.text().lower().strip()
+        # Identical normalized needle (trailing space typed/deleted,
+        # clear button re-fire) — nothing to recompute
+        if needle == self._last_needle:
+            return
+        # Typing usually extends the needle; a stricter needle can never
+        # reveal a hidden card, so those skip the substring scan
+        narrowing = bool(self._last_needle) and needle.startswith(self._last_needle)
+        self._last_needle = needle
         for card, search_text in self._cards:
-            card.setVisible(not needle or needle in search_text)
+            visible_now = card.isVisibleTo(card.parentWidget())
+            if narrowing and not visible_now:
+                continue
+            visible = not needle or needle in search_text
+            # Only touch widgets whose state actually flips — setVisible
+            # on an unchanged card still costs a style recalc
+            if visible_now != visible:
+                card.setVisible(visible)
+        # Filtering may scroll new cards into view
+        self._realize_visible()
+
+    def _realize_visible(self):
+        """Build real input widgets for cards intersecting the viewport."""
+        if not self._pending:
+            return
+        viewport = self._scroll.viewport()
+        height = viewport.height()
+        for key in list(self._pending):
+            placeholder, setting, card = self._pending[key]
+            if not card.isVisibleTo(card.parentWidget()):
+                continue
+            top = card.mapTo(viewport, QPoint(0, 0)).y()
+            if top > height or top + card.height() < 0:
+                continue
+            del self._pending[key]
+            widget = self._create_widget(setting)
+            self._widgets[key] = widget
+            self._connect_dirty(key, widget)
+            card.layout().replaceWidget(placeholder, widget)
+            placeholder.deleteLater()
 
     def _create_widget(self, setting: IniSetting) -> QWidget:
         vtype = setting.value_type
@@ -148,24 +253,30 @@ class ServerSettingsDialog(QDialog):
         edit = QLineEdit(setting.value)
         return edit
 
+    @staticmethod
+    def _format_double(widget: QDoubleSpinBox) -> str:
+        val = widget.value()
+        ival = int(val)
+        return f"{val:.1f}" if val == ival else f"{val:.2f}"
+
+    def _connect_dirty(self, key: str, widget: QWidget) -> None:
+        """Record the key on any user edit so _on_save is O(#changed)."""
+        mark = lambda *_: self._dirty_keys.add(key)  # noqa: E731
+        if isinstance(widget, QCheckBox):
+            widget.stateChanged.connect(mark)
+        elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+            widget.valueChanged.connect(mark)
+        elif isinstance(widget, QLineEdit):
+            widget.textChanged.connect(mark)
+
     def _get_widget_value(self, key: str) -> str:
         widget = self._widgets[key]
-        if isinstance(widget, QCheckBox):
-            return "true" if widget.isChecked() else "false"
-        if isinstance(widget, QSpinBox):
-            return str(widget.value())
-        if isinstance(widget, QDoubleSpinBox):
-            val = widget.value()
-            if val == int(val) and "." in self._original.get(key, ""):
-                return f"{val:.1f}"
-            return f"{val:.2f}" if val != int(val) else f"{val:.1f}"
-        if isinstance(widget, QLineEdit):
-            return widget.text()
-        return ""
+        getter = self._value_getters.get(type(widget))
+        return getter(widget) if getter else ""
 
     def _on_save(self):
         changes: dict[str, str] = {}
-        for key in self._widgets:
+        for key in self._dirty_keys:
             new_val = self._get_widget_value(key)
             if new_val != self._original[key]:
                 changes[key] = new_val
@@ -182,21 +293,9 @@ class ServerSettingsDialog(QDialog):
         else:
             self.resize(750, 600)
 
-    def closeEvent(self, event):
+    def done(self, result: int):
+        # Every dismissal path (OK, Cancel, window close) funnels
+        # through done(), so the geometry is serialized exactly once
         self._qsettings.setValue("server_settings_geometry", self.saveGeometry())
-        super().closeEvent(event)
+        super().done(result)
 
-    def accept(self):
-        self._qsettings.setValue("server_settings_geometry", self.saveGeometry())
-        super().accept()
-
-    def reject(self):
-        self._qsettings.setValue("server_settings_geometry", self.saveGeometry())
-        super().reject()
-
-    @staticmethod
-    def _key_to_label(key: str) -> str:
-        """Convert CamelCase key to a readable label."""
-        spaced = re.sub(r"(?<=[a-z])(?=[A-Z])", " ", key)
-        spaced = re.sub(r"(?<=[A-Z])(?=[A-Z][a-z])", " ", spaced)
-        return spaced
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import webbrowser
 
+from PySide6.QtCore import QSignalBlocker
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -33,7 +34,9 @@ class SettingsDialog(QDialog):
         ws_layout = QHBoxLayout()
         self._workshop_edit = QLineEdit()
         self._workshop_edit.setPlaceholderText("Path to Steam workshop content directory")
-        self._workshop_edit.setText(self._settings.workshop_path)
+        # Programmatic setText must not fire textChanged work
+        with QSignalBlocker(self._workshop_edit):
+            self._workshop_edit.setText(self._settings.workshop_path)
         ws_layout.addWidget(self._workshop_edit)
         browse_btn = QPushButton("Browse...")
         browse_btn.clicked.connect(self._browse_workshop)
@@ -53,7 +56,8 @@ class SettingsDialog(QDialog):
         self._api_key_edit = QLineEdit()
         self._api_key_edit.setPlaceholderText("Enter your Steam Web API key")
         self._api_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self._api_key_edit.setText(self._settings.api_key)
+        with QSignalBlocker(self._api_key_edit):
+            self._api_key_edit.setText(self._settings.api_key)
         form.addRow("Steam API Key:", self._api_key_edit)
 
         get_key_btn = QPushButton("Get API Key from Steam")
@@ -76,7 +80,8 @@ class SettingsDialog(QDialog):
             self, "Select Workshop Directory", self._workshop_edit.text()
         )
         if path:
-            self._workshop_edit.setText(path)
+            with QSignalBlocker(self._workshop_edit):
+                self._workshop_edit.setText(path)
 
     def _on_accept(self):
         self._settings.api_key = self._api_key_edit.text().strip()
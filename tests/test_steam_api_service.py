@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,6 +13,7 @@ def service():
 
 def _mock_response(json_data, status_code=200):
     mock = MagicMock()
+    mock.content = json.dumps(json_data).encode()
     mock.json.return_value = json_data
     mock.status_code = status_code
     mock.raise_for_status.return_value = None
@@ -19,7 +21,7 @@ def _mock_response(json_data, status_code=200):
 
 
 class TestFetchModDetails:
-    @patch("pz_mod_manager.services.steam_api_service.requests.get")
+    @patch("pz_mod_manager.services.steam_api_service.requests.Session.get")
     def test_returns_details(self, mock_get, service):
         mock_get.return_value = _mock_response(
             {
@@ -41,7 +43,7 @@ class TestFetchModDetails:
         assert results[0]["title"] == "Test Mod"
         assert results[0]["publishedfileid"] == "123"
 
-    @patch("pz_mod_manager.services.steam_api_service.requests.get")
+    @patch("pz_mod_manager.services.steam_api_service.requests.Session.get")
     def test_skips_not_found(self, mock_get, service):
         mock_get.return_value = _mock_response(
             {
@@ -58,7 +60,7 @@ class TestFetchModDetails:
     def test_empty_list(self, service):
         assert service.fetch_mod_details([]) == []
 
-    @patch("pz_mod_manager.services.steam_api_service.requests.get")
+    @patch("pz_mod_manager.services.steam_api_service.requests.Session.get")
     def test_network_error(self, mock_get, service):
         import requests
 
@@ -68,7 +70,7 @@ class TestFetchModDetails:
 
 
 class TestFetchSingleMod:
-    @patch("pz_mod_manager.services.steam_api_service.requests.get")
+    @patch("pz_mod_manager.services.steam_api_service.requests.Session.get")
     def test_returns_single(self, mock_get, service):
         mock_get.return_value = _mock_response(
             {
@@ -89,7 +91,7 @@ class TestFetchSingleMod:
         assert result is not None
         assert result["title"] == "Single Mod"
 
-    @patch("pz_mod_manager.services.steam_api_service.requests.get")
+    @patch("pz_mod_manager.services.steam_api_service.requests.Session.get")
     def test_returns_none_when_not_found(self, mock_get, service):
         mock_get.return_value = _mock_response(
             {"response": {"publishedfiledetails": [{"result": 9}]}}
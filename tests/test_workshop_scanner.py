@@ -59,6 +59,20 @@ class TestScanWorkshopContent:
         mod_d = next(r for r in results if r.mod_id == "ModD")
         assert mod_d.name == "Mod D New"
 
+    def test_numeric_version_ordering(self, tmp_path):
+        """Version dirs compare numerically: 42.13 beats 42.2."""
+        mod_e = tmp_path / "content" / "108600" / "444" / "mods" / "ModE"
+        older = mod_e / "42.2"
+        older.mkdir(parents=True)
+        (older / "mod.info").write_text("name=Mod E Old\nid=ModE\n")
+        newer = mod_e / "42.13"
+        newer.mkdir()
+        (newer / "mod.info").write_text("name=Mod E New\nid=ModE\n")
+
+        results = scan_workshop_content(tmp_path)
+        assert len(results) == 1
+        assert results[0].name == "Mod E New"
+
     def test_empty_dir(self, tmp_path):
         assert scan_workshop_content(tmp_path) == []
 